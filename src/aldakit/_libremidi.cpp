@@ -1,11 +1,13 @@
 #include <libremidi/libremidi.hpp>
 
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/stl/function.h>
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/string_view.h>
 #include <nanobind/stl/vector.h>
 
+#include <algorithm>
 #include <deque>
 #include <mutex>
 
@@ -70,6 +72,29 @@ struct MidiInWrapper {
     return messages;
   }
 
+  // Drain up to `capacity` messages into caller-owned buffers without
+  // allocating: 3 bytes per message (shorter messages zero-padded) and one
+  // timestamp each. Messages that do not fit stay queued.
+  size_t poll_into(
+      nb::ndarray<uint8_t, nb::ndim<1>, nb::c_contig, nb::device::cpu> data,
+      nb::ndarray<int64_t, nb::ndim<1>, nb::c_contig, nb::device::cpu> timestamps) {
+    const size_t capacity = std::min(data.shape(0) / 3, timestamps.shape(0));
+    uint8_t* out = data.data();
+    int64_t* ts = timestamps.data();
+
+    std::lock_guard<std::mutex> lock(queue_mutex);
+    size_t count = 0;
+    while (count < capacity && !message_queue.empty()) {
+      const MidiMessage& msg = message_queue.front();
+      const size_t n = std::min<size_t>(msg.bytes.size(), 3);
+      std::fill_n(std::copy_n(msg.bytes.begin(), n, out + 3 * count), 3 - n, 0);
+      ts[count] = msg.timestamp;
+      message_queue.pop_front();
+      ++count;
+    }
+    return count;
+  }
+
   // Check if there are pending messages
   bool has_messages() {
     std::lock_guard<std::mutex> lock(queue_mutex);
@@ -155,6 +180,9 @@ NB_MODULE(_libremidi, m) {
       .def("is_port_open", &MidiInWrapper::is_port_open)
       .def("poll", &MidiInWrapper::poll,
            "Poll for incoming MIDI messages. Returns a list of MidiMessage objects.")
+      .def("poll_into", &MidiInWrapper::poll_into, nb::arg("data"), nb::arg("timestamps"),
+           "Drain messages into preallocated buffers (3 bytes each in `data`, one "
+           "int64 per message in `timestamps`). Returns the number written.")
       .def("has_messages", &MidiInWrapper::has_messages,
            "Check if there are pending messages without consuming them.")
       .def("absolute_timestamp", &MidiInWrapper::absolute_timestamp,
@@ -9,7 +9,13 @@ from .tokens import SourcePosition
 
 
 class ASTNode(ABC):
-    """Base class for all AST nodes."""
+    """Base class for all AST nodes.
+
+    Concrete nodes are slotted dataclasses; a parsed score creates one
+    node per note, duration and attribute, so they carry no ``__dict__``.
+    """
+
+    __slots__ = ()
 
     position: SourcePosition | None = None
 
@@ -44,7 +50,7 @@ class ASTVisitor(ABC):
 # Top-level nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class RootNode(ASTNode):
     """Root of the AST, contains all parts and events."""
 
@@ -61,7 +67,7 @@ class RootNode(ASTNode):
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class PartNode(ASTNode):
     """A part (instrument) declaration with its events."""
 
@@ -79,7 +85,7 @@ class PartNode(ASTNode):
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class PartDeclarationNode(ASTNode):
     """Part declaration (e.g., 'piano:', 'violin "v1":')."""
 
@@ -96,7 +102,7 @@ class PartDeclarationNode(ASTNode):
         return f"PartDeclarationNode(names={self.names})"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSequenceNode(ASTNode):
     """A sequence of musical events."""
 
@@ -118,7 +124,7 @@ class EventSequenceNode(ASTNode):
 # Musical event nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteNode(ASTNode):
     """A musical note."""
 
@@ -143,7 +149,7 @@ class NoteNode(ASTNode):
         return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class RestNode(ASTNode):
     """A rest."""
 
@@ -159,7 +165,7 @@ class RestNode(ASTNode):
         return "RestNode()"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChordNode(ASTNode):
     """A chord (multiple notes played simultaneously)."""
 
@@ -186,7 +192,7 @@ class ChordNode(ASTNode):
 # Duration nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class DurationNode(ASTNode):
     """A duration specification."""
 
@@ -206,10 +212,10 @@ class DurationNode(ASTNode):
 class DurationComponentNode(ASTNode):
     """Base class for duration components."""
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteLengthNode(DurationComponentNode):
     """A note length (e.g., 4 for quarter, 8 for eighth)."""
 
@@ -226,7 +232,7 @@ class NoteLengthNode(DurationComponentNode):
         return f"NoteLengthNode({self.denominator})"
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteLengthMsNode(DurationComponentNode):
     """A duration in milliseconds."""
 
@@ -240,7 +246,7 @@ class NoteLengthMsNode(DurationComponentNode):
         return f"NoteLengthMsNode({self.ms}ms)"
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteLengthSecondsNode(DurationComponentNode):
     """A duration in seconds."""
 
@@ -254,7 +260,7 @@ class NoteLengthSecondsNode(DurationComponentNode):
         return f"NoteLengthSecondsNode({self.seconds}s)"
 
 
-@dataclass
+@dataclass(slots=True)
 class BarlineNode(ASTNode):
     """A barline (|) - mainly for visual organization."""
 
@@ -270,7 +276,7 @@ class BarlineNode(ASTNode):
 # Octave nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class OctaveSetNode(ASTNode):
     """Set octave to absolute value (e.g., o4)."""
 
@@ -284,7 +290,7 @@ class OctaveSetNode(ASTNode):
         return f"OctaveSetNode({self.octave})"
 
 
-@dataclass
+@dataclass(slots=True)
 class OctaveUpNode(ASTNode):
     """Increase octave by one (>)."""
 
@@ -297,7 +303,7 @@ class OctaveUpNode(ASTNode):
         return "OctaveUpNode()"
 
 
-@dataclass
+@dataclass(slots=True)
 class OctaveDownNode(ASTNode):
     """Decrease octave by one (<)."""
 
@@ -313,7 +319,7 @@ class OctaveDownNode(ASTNode):
 # S-expression (Lisp) nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class LispListNode(ASTNode):
     """A Lisp S-expression (e.g., (tempo 120))."""
 
@@ -333,10 +339,10 @@ class LispListNode(ASTNode):
 class LispNode(ASTNode):
     """Base class for Lisp expression elements."""
 
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class LispSymbolNode(LispNode):
     """A Lisp symbol."""
 
@@ -350,7 +356,7 @@ class LispSymbolNode(LispNode):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class LispNumberNode(LispNode):
     """A Lisp number."""
 
@@ -364,7 +370,7 @@ class LispNumberNode(LispNode):
         return str(self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class LispStringNode(LispNode):
     """A Lisp string."""
 
@@ -378,7 +384,7 @@ class LispStringNode(LispNode):
         return f'"{self.value}"'
 
 
-@dataclass
+@dataclass(slots=True)
 class LispQuotedNode(LispNode):
     """A quoted Lisp expression (e.g., '(g minor) or 'up)."""
 
@@ -395,7 +401,7 @@ class LispQuotedNode(LispNode):
 # Variable nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableDefinitionNode(ASTNode):
     """A variable definition (e.g., 'myMotif = c d e')."""
 
@@ -412,7 +418,7 @@ class VariableDefinitionNode(ASTNode):
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableReferenceNode(ASTNode):
     """A reference to a variable."""
 
@@ -429,7 +435,7 @@ class VariableReferenceNode(ASTNode):
 # Marker nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkerNode(ASTNode):
     """A marker definition (e.g., '%verse')."""
 
@@ -443,7 +449,7 @@ class MarkerNode(ASTNode):
         return f"MarkerNode({self.name!r})"
 
 
-@dataclass
+@dataclass(slots=True)
 class AtMarkerNode(ASTNode):
     """A marker reference (e.g., '@verse')."""
 
@@ -460,7 +466,7 @@ class AtMarkerNode(ASTNode):
 # Voice nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceNode(ASTNode):
     """A single voice within a voice group."""
 
@@ -477,7 +483,7 @@ class VoiceNode(ASTNode):
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceGroupNode(ASTNode):
     """A group of voices (V1:, V2:, etc. until V0:)."""
 
@@ -497,7 +503,7 @@ class VoiceGroupNode(ASTNode):
 # Cram expression node
 
 
-@dataclass
+@dataclass(slots=True)
 class CramNode(ASTNode):
     """A cram expression (e.g., '{c d e}2')."""
 
@@ -520,7 +526,7 @@ class CramNode(ASTNode):
 # Repeat nodes
 
 
-@dataclass
+@dataclass(slots=True)
 class RepeatNode(ASTNode):
     """A repeated event or sequence (e.g., '[c d e]*4')."""
 
@@ -537,7 +543,7 @@ class RepeatNode(ASTNode):
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class RepetitionRange:
     """A range of repetition numbers (e.g., 1-3 or just 5)."""
 
@@ -550,7 +556,7 @@ class RepetitionRange:
         return f"{self.first}-{self.last}"
 
 
-@dataclass
+@dataclass(slots=True)
 class OnRepetitionsNode(ASTNode):
     """An event with repetition conditions (e.g., \"c'1-3,5\")."""
 
@@ -571,7 +577,7 @@ class OnRepetitionsNode(ASTNode):
 # Bracketed event sequence (can be repeated)
 
 
-@dataclass
+@dataclass(slots=True)
 class BracketedSequenceNode(ASTNode):
     """A bracketed event sequence (e.g., '[c d e]')."""
 
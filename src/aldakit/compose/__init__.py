@@ -98,6 +98,7 @@ from .core import (
     voice_group,
 )
 from .generate import (  # Random selection; Random walks; Rhythmic generators; Markov chains; L-Systems; Cellular automata; Shift registers
+    LFSR,
     MarkovChain,
     cellular_automaton,
     drunk_walk,
@@ -113,6 +114,8 @@ from .generate import (  # Random selection; Random walks; Rhythmic generators;
     shift_register,
     turing_machine,
     weighted_choice,
+    weighted_choices,
+    weighted_sampler,
 )
 from .part import Part, part
 from .scales import (
@@ -227,6 +230,8 @@ __all__ = [
     "random_note",
     "random_choice",
     "weighted_choice",
+    "weighted_choices",
+    "weighted_sampler",
     # Random walks
     "random_walk",
     "drunk_walk",
@@ -244,6 +249,7 @@ __all__ = [
     "cellular_automaton",
     # Shift registers
     "shift_register",
+    "LFSR",
     "turing_machine",
     # Scales
     "scale",
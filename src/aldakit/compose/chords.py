@@ -6,8 +6,10 @@ such as major, minor, diminished, augmented, and various seventh chords.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .core import Chord, Note, note
-from .scales import OFFSET_TO_PITCH, PITCH_TO_OFFSET
+from .scales import OFFSET_TO_PITCH, _pitch_offset
 
 # =============================================================================
 # Chord Interval Definitions
@@ -84,35 +86,35 @@ def build_chord(
         available = ", ".join(sorted(CHORD_INTERVALS.keys()))
         raise ValueError(f"Unknown chord type: {chord_type}. Available: {available}")
 
-    # Parse root note
-    if len(root) > 1 and root[1] in "+-":
-        base_pitch = root[0].lower()
-        root_acc = root[1]
-        root_offset = PITCH_TO_OFFSET[base_pitch]
-        if root_acc == "+":
-            root_offset += 1
-        elif root_acc == "-":
-            root_offset -= 1
-        root_offset = root_offset % 12
-    else:
-        base_pitch = root.lower()
-        root_offset = PITCH_TO_OFFSET[base_pitch]
-        root_acc = None
-
-    intervals = list(CHORD_INTERVALS[chord_type])
+    root_offset = _pitch_offset(root)
+    return _chord(
+        root_offset, tuple(CHORD_INTERVALS[chord_type]), octave, inversion, duration
+    )
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _chord(
+    root_offset: int,
+    intervals: tuple[int, ...],
+    octave: int,
+    inversion: int,
+    duration: int | None,
+) -> Chord:
+    """Build a chord; Chord and Note are frozen, so equal calls share one."""
+    offsets = list(intervals)
 
     # Apply inversion by rotating intervals and adjusting octaves
     if inversion > 0:
-        inversion = inversion % len(intervals)
+        inversion = inversion % len(offsets)
         # Move lower notes up an octave
         for i in range(inversion):
-            intervals[i] += 12
+            offsets[i] += 12
         # Sort to maintain ascending order
-        intervals.sort()
+        offsets.sort()
 
     # Build notes
     notes = []
-    for interval in intervals:
+    for interval in offsets:
         pitch_offset = (root_offset + interval) % 12
         octave_offset = (root_offset + interval) // 12
         pitch_name, accidental = OFFSET_TO_PITCH[pitch_offset]
@@ -499,24 +501,21 @@ def arpeggiate(
         >>> arpeggiate(c_maj, [0, 1, 2, 1])  # C E G E
         >>> arpeggiate(c_maj, duration=16)  # C E G as 16th notes
     """
-    notes = list(chord.notes)
+    # Build each chord tone once; patterns usually revisit them
+    notes = [
+        note(
+            n.pitch,
+            duration=duration if duration else n.duration,
+            octave=n.octave,
+            accidental=n.accidental,
+        )
+        for n in chord.notes
+    ]
 
     if pattern is None:
-        pattern = list(range(len(notes)))
+        return notes
 
-    result = []
-    for idx in pattern:
-        n = notes[idx % len(notes)]
-        result.append(
-            note(
-                n.pitch,
-                duration=duration if duration else n.duration,
-                octave=n.octave,
-                accidental=n.accidental,
-            )
-        )
-
-    return result
+    return [notes[idx % len(notes)] for idx in pattern]
 
 
 def invert(chord: Chord, inversion: int) -> Chord:
@@ -585,18 +584,20 @@ def voicing(
     if len(octaves) != len(notes):
         raise ValueError(f"octaves list must have {len(notes)} elements")
 
-    new_notes = []
-    for nt, oct in zip(notes, octaves):
-        new_notes.append(
-            note(
-                nt.pitch,
-                duration=nt.duration,
-                octave=oct,
-                accidental=nt.accidental,
-            )
-        )
+    new_notes = tuple(
+        _voiced_note(nt.pitch, nt.accidental, nt.duration, oct)
+        for nt, oct in zip(notes, octaves)
+    )
 
-    return Chord(notes=tuple(new_notes), duration=chord.duration)
+    return Chord(notes=new_notes, duration=chord.duration)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _voiced_note(
+    pitch: str, accidental: str | None, duration: int | None, octave: int
+) -> Note:
+    """Chord tone placed in an octave; shared between voicings as Note is frozen."""
+    return note(pitch, duration=duration, octave=octave, accidental=accidental)
 
 
 def list_chord_types() -> list[str]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any
 
 from .base import ComposeElement
@@ -35,6 +36,23 @@ _SEMITONE_TO_PITCH = ["c", "c", "d", "d", "e", "f", "f", "g", "g", "a", "a", "b"
 _SEMITONE_ACCIDENTALS = ["", "+", "", "+", "", "", "+", "", "+", "", "+", ""]
 
 
+@lru_cache(maxsize=256)
+def _pitch_class_offset(pitch: str, accidental: str | None) -> int:
+    """Semitones above C for a pitch letter plus accidentals.
+
+    Cached: the domain is tiny (7 letters times a handful of accidental
+    strings) but this is hit for every note that is transposed or compared.
+    """
+    offset = _PITCH_OFFSETS[pitch.lower()]
+
+    # Apply accidentals
+    if accidental:
+        offset += accidental.count("+") - accidental.count("-")
+        # "_" (natural) doesn't change offset
+
+    return offset
+
+
 @dataclass(frozen=True)
 class Note(ComposeElement):
     """A musical note.
@@ -114,26 +132,26 @@ class Note(ComposeElement):
 
     def to_alda(self) -> str:
         """Convert to Alda source code."""
-        result = self.pitch.lower()
-
-        # Accidentals
-        if self.accidental:
-            result += self.accidental
+        return self._alda
 
+    @cached_property
+    def _alda(self) -> str:
+        """Alda source for this note, rendered once per (immutable) instance."""
         # Duration
         if self.ms is not None:
-            result += f"{int(self.ms)}ms"
+            length = f"{int(self.ms)}ms"
         elif self.seconds is not None:
-            result += f"{self.seconds}s"
+            length = f"{self.seconds}s"
         elif self.duration is not None:
-            result += str(self.duration)
-            result += "." * self.dots
+            length = f"{self.duration}{'.' * self.dots}"
+        else:
+            length = ""
 
-        # Slur
-        if self.slurred:
-            result += "~"
+        # Accidentals and slur
+        accidental = self.accidental or ""
+        slur = "~" if self.slurred else ""
 
-        return result
+        return f"{self.pitch.lower()}{accidental}{length}{slur}"
 
     @property
     def midi_pitch(self) -> int:
@@ -142,19 +160,7 @@ class Note(ComposeElement):
         Uses octave 4 as default if not specified.
         """
         oct = self.octave if self.octave is not None else 4
-        base = _PITCH_OFFSETS[self.pitch.lower()]
-
-        # Apply accidentals
-        offset = 0
-        if self.accidental:
-            for acc in self.accidental:
-                if acc == "+":
-                    offset += 1
-                elif acc == "-":
-                    offset -= 1
-                # "_" (natural) doesn't change offset
-
-        return (oct + 1) * 12 + base + offset
+        return (oct + 1) * 12 + _pitch_class_offset(self.pitch, self.accidental)
 
     # Transformation methods (return new Note instances)
 
@@ -254,17 +260,13 @@ class Rest(ComposeElement):
 
     def to_alda(self) -> str:
         """Convert to Alda source code."""
-        result = "r"
-
         if self.ms is not None:
-            result += f"{int(self.ms)}ms"
+            return f"r{int(self.ms)}ms"
         elif self.seconds is not None:
-            result += f"{self.seconds}s"
+            return f"r{self.seconds}s"
         elif self.duration is not None:
-            result += str(self.duration)
-            result += "." * self.dots
-
-        return result
+            return f"r{self.duration}{'.' * self.dots}"
+        return "r"
 
 
 @dataclass(frozen=True)
@@ -331,7 +333,7 @@ class Seq(ComposeElement):
 
     def to_alda(self) -> str:
         """Convert to Alda source code."""
-        return " ".join(e.to_alda() for e in self.elements)
+        return " ".join([e.to_alda() for e in self.elements])
 
     @classmethod
     def from_alda(cls, source: str) -> Seq:
@@ -4,20 +4,35 @@ This module provides tools for creating musical material algorithmically,
 useful for composition, experimentation, and live coding.
 
 Categories:
-- Random selection: random_note, random_choice, weighted_choice
+- Random selection: random_note, random_choice, weighted_choice,
+  weighted_choices, weighted_sampler
 - Random walks: random_walk, drunk_walk
 - Rhythmic generators: euclidean, probability_seq, rest_probability
 - Pattern-based: markov_chain, learn_markov, lsystem, cellular_automaton
+- Circuits: shift_register, LFSR, turing_machine
 """
 
 from __future__ import annotations
 
 import random
+from bisect import bisect
 from collections import defaultdict
-from typing import TYPE_CHECKING, TypeVar
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 from .base import ComposeElement
-from .core import Note, Rest, Seq, note, rest, seq
+from .core import (
+    _SEMITONE_ACCIDENTALS,
+    _SEMITONE_TO_PITCH,
+    Note,
+    Rest,
+    Seq,
+    note,
+    rest,
+    seq,
+)
 
 if TYPE_CHECKING:
     pass
@@ -36,6 +51,7 @@ def random_note(
     duration: int | None = None,
     octave: int | None = None,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Note:
     """Generate a random note from a scale.
 
@@ -44,6 +60,8 @@ def random_note(
         duration: Optional duration for the note.
         octave: Optional octave for the note.
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A randomly selected Note.
@@ -55,7 +73,7 @@ def random_note(
     if scale is None:
         scale = ["c", "d", "e", "f", "g", "a", "b"]
 
-    rng = random.Random(seed)
+    rng = _get_rng(seed, rng)
     pitch = rng.choice(scale)
     return note(pitch, duration=duration, octave=octave)
 
@@ -64,12 +82,15 @@ def random_choice(
     options: list[T],
     *,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> T:
     """Randomly select one item from a list of options.
 
     Args:
         options: List of items to choose from (notes, chords, sequences, etc.).
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A randomly selected item.
@@ -81,7 +102,7 @@ def random_choice(
     if not options:
         raise ValueError("options list cannot be empty")
 
-    rng = random.Random(seed)
+    rng = _get_rng(seed, rng)
     return rng.choice(options)
 
 
@@ -89,6 +110,7 @@ def weighted_choice(
     weighted_options: list[tuple[T, float]],
     *,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> T:
     """Randomly select an item based on probability weights.
 
@@ -96,6 +118,8 @@ def weighted_choice(
         weighted_options: List of (item, weight) tuples. Weights don't need
             to sum to 1.0; they will be normalized.
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A randomly selected item based on weights.
@@ -107,21 +131,106 @@ def weighted_choice(
         ...     (note("g"), 0.2),  # 20% chance
         ... ])
     """
-    if not weighted_options:
-        raise ValueError("weighted_options list cannot be empty")
+    items, cum_weights = _cumulative_weights(weighted_options)
+    rng = _get_rng(seed, rng)
+    return items[_weighted_index(rng, cum_weights)]
 
-    items = [item for item, _ in weighted_options]
-    weights = [weight for _, weight in weighted_options]
 
-    if any(w < 0 for w in weights):
-        raise ValueError("weights cannot be negative")
+def weighted_choices(
+    weighted_options: list[tuple[T, float]],
+    k: int,
+    *,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> list[T]:
+    """Randomly select ``k`` items (with replacement) based on probability weights.
 
-    total = sum(weights)
-    if total == 0:
-        raise ValueError("total weight cannot be zero")
+    Equivalent to calling weighted_choice ``k`` times on one shared
+    generator, but validates and accumulates the weights only once.
 
-    rng = random.Random(seed)
-    return rng.choices(items, weights=weights, k=1)[0]
+    Args:
+        weighted_options: List of (item, weight) tuples. Weights don't need
+            to sum to 1.0; they will be normalized.
+        k: Number of items to select.
+        seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
+
+    Returns:
+        A list of ``k`` randomly selected items.
+
+    Examples:
+        >>> seq(*weighted_choices([(note("c"), 3), (note("g"), 1)], 16))
+    """
+    items, cum_weights = _cumulative_weights(weighted_options)
+    rng = _get_rng(seed, rng)
+    return rng.choices(items, cum_weights=cum_weights, k=k)
+
+
+def weighted_sampler(
+    weighted_options: list[tuple[T, float]],
+    *,
+    seed: int | None = None,
+    rng: random.Random | None = None,
+) -> Callable[[], T]:
+    """Prepare a weighted distribution for repeated O(1) sampling.
+
+    Builds a Walker alias table once so that each draw costs a single
+    random number, regardless of how many options there are. Use this
+    instead of calling weighted_choice in a loop over the same options.
+
+    Args:
+        weighted_options: List of (item, weight) tuples. Weights don't need
+            to sum to 1.0; they will be normalized.
+        seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
+
+    Returns:
+        A function taking no arguments that returns one randomly selected
+        item per call.
+
+    Examples:
+        >>> draw = weighted_sampler([(note("c"), 0.5), (note("g"), 0.5)])
+        >>> melody = seq(*(draw() for _ in range(16)))
+    """
+    items, weights, total = _validate_weights(weighted_options)
+    prob, alias = _alias_table(weights, total)
+    n = len(items)
+    rng = _get_rng(seed, rng)
+
+    def draw() -> T:
+        # Split one uniform draw into a column index and a coin flip
+        u = rng.random() * n
+        i = int(u)
+        return items[i] if u - i < prob[i] else items[alias[i]]
+
+    return draw
+
+
+def _alias_table(weights: list[float], total: float) -> tuple[list[float], list[int]]:
+    """Build Walker's alias table (Vose's method) for the given weights."""
+    n = len(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= 1.0 - scaled[s]
+        if scaled[g] < 1.0:
+            small.append(g)
+        else:
+            large.append(g)
+
+    # Leftovers are full columns (up to floating-point error)
+    return prob, alias
 
 
 # =============================================================================
@@ -139,6 +248,7 @@ def random_walk(
     min_pitch: int = 36,
     max_pitch: int = 84,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Seq:
     """Generate a melody using a random walk through pitch space.
 
@@ -153,6 +263,8 @@ def random_walk(
         min_pitch: Minimum MIDI pitch (to constrain range).
         max_pitch: Maximum MIDI pitch (to constrain range).
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A Seq containing the random walk melody.
@@ -167,17 +279,18 @@ def random_walk(
     if steps < 1:
         return seq()
 
-    rng = random.Random(seed)
+    rng = _get_rng(seed, rng)
+    choice = rng.choice
 
     # Start note
-    current = note(start, duration=duration, octave=octave)
-    elements: list[ComposeElement] = [current]
-    current_midi = current.midi_pitch
+    first = note(start, duration=duration, octave=octave)
+    current_midi = first.midi_pitch
 
+    # Walk in integer pitch space first; build notes in one pass afterwards
+    pitches: list[int] = []
     for _ in range(steps - 1):
         # Choose a random interval
-        interval = rng.choice(intervals)
-        new_midi = current_midi + interval
+        new_midi = current_midi + choice(intervals)
 
         # Clamp to range, reflecting if necessary
         if new_midi < min_pitch:
@@ -188,11 +301,11 @@ def random_walk(
         # Clamp again in case of double reflection
         new_midi = max(min_pitch, min(max_pitch, new_midi))
 
-        # Create note from MIDI pitch
-        new_note = _midi_to_note(new_midi, duration=duration)
-        elements.append(new_note)
+        pitches.append(new_midi)
         current_midi = new_midi
 
+    elements: list[ComposeElement] = [first]
+    elements.extend(_midi_to_note(p, duration=duration) for p in pitches)
     return Seq(elements=elements)
 
 
@@ -207,6 +320,7 @@ def drunk_walk(
     max_pitch: int = 84,
     bias: float = 0.0,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Seq:
     """Generate a melody using a "drunk walk" biased toward smaller intervals.
 
@@ -223,6 +337,8 @@ def drunk_walk(
         max_pitch: Maximum MIDI pitch.
         bias: Directional bias (-1 to 1). Positive = upward, negative = downward.
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A Seq containing the drunk walk melody.
@@ -234,41 +350,42 @@ def drunk_walk(
     if steps < 1:
         return seq()
 
-    rng = random.Random(seed)
+    rng = _get_rng(seed, rng)
+    randint = rng.randint
+    span = max_pitch - min_pitch
 
     # Start note
-    current = note(start, duration=duration, octave=octave)
-    elements: list[ComposeElement] = [current]
-    current_midi = current.midi_pitch
+    first = note(start, duration=duration, octave=octave)
+    current_midi = first.midi_pitch
 
+    # Walk in integer pitch space first; build notes in one pass afterwards
+    pitches: list[int] = []
     for _ in range(steps - 1):
         # Triangular distribution centered at 0, favoring small steps
         # We generate by summing two uniform random values
-        step = rng.randint(-max_step, max_step)
+        step = randint(-max_step, max_step)
 
         # Apply bias
         if bias != 0:
-            bias_step = int(bias * max_step * rng.random())
-            step += bias_step
+            step += int(bias * max_step * rng.random())
 
         # Second random component to create triangular-ish distribution
-        step2 = rng.randint(-max_step, max_step)
-        interval = (step + step2) // 2
-
-        new_midi = current_midi + interval
+        step2 = randint(-max_step, max_step)
+        new_midi = current_midi + (step + step2) // 2
 
         # Clamp to range
         if new_midi < min_pitch:
-            new_midi = min_pitch + (min_pitch - new_midi) % (max_pitch - min_pitch)
+            new_midi = min_pitch + (min_pitch - new_midi) % span
         elif new_midi > max_pitch:
-            new_midi = max_pitch - (new_midi - max_pitch) % (max_pitch - min_pitch)
+            new_midi = max_pitch - (new_midi - max_pitch) % span
 
         new_midi = max(min_pitch, min(max_pitch, new_midi))
 
-        new_note = _midi_to_note(new_midi, duration=duration)
-        elements.append(new_note)
+        pitches.append(new_midi)
         current_midi = new_midi
 
+    elements: list[ComposeElement] = [first]
+    elements.extend(_midi_to_note(p, duration=duration) for p in pitches)
     return Seq(elements=elements)
 
 
@@ -313,53 +430,55 @@ def euclidean(
     if steps == 0:
         return seq()
 
-    # Bjorklund's algorithm for Euclidean rhythms
+    # Bjorklund's algorithm for Euclidean rhythms, as a bitmask of hits
     pattern = _bjorklund(hits, steps)
 
     # Rotate if requested
     if rotate != 0:
-        rotate = rotate % len(pattern)
-        pattern = pattern[rotate:] + pattern[:rotate]
+        rotate = rotate % steps
+        full = (1 << steps) - 1
+        pattern = ((pattern >> rotate) | (pattern << (steps - rotate))) & full
 
-    # Convert to notes and rests
-    elements = []
-    for is_hit in pattern:
-        if is_hit:
-            elements.append(note(pitch, duration=duration))
-        else:
-            elements.append(rest(duration=duration))
+    # Start from all rests, then visit only the set bits to place the hits
+    elements: list[ComposeElement] = [_rest(duration)] * steps
+    while pattern:
+        lowest = pattern & -pattern
+        elements[lowest.bit_length() - 1] = note(pitch, duration=duration)
+        pattern ^= lowest
 
     return Seq(elements=elements)
 
 
-def _bjorklund(hits: int, steps: int) -> list[bool]:
-    """Bjorklund's algorithm for computing Euclidean rhythms."""
+def _bjorklund(hits: int, steps: int) -> int:
+    """Bjorklund's algorithm for computing Euclidean rhythms.
+
+    At every stage all groups are identical, and so are all remainders, so
+    only one pattern and a count are tracked for each; this reduces to
+    Euclid's algorithm on the counts.
+
+    Returns:
+        A bitmask with bit ``i`` set when step ``i`` is a hit.
+    """
     if hits == 0:
-        return [False] * steps
+        return 0
     if hits == steps:
-        return [True] * steps
-
-    # Initialize groups
-    groups: list[list[bool]] = [[True] for _ in range(hits)]
-    remainder: list[list[bool]] = [[False] for _ in range(steps - hits)]
+        return (1 << steps) - 1
 
-    while len(remainder) > 1:
-        new_groups = []
-        while groups and remainder:
-            g = groups.pop(0)
-            r = remainder.pop(0)
-            new_groups.append(g + r)
+    group, n_groups = "1", hits
+    remainder, n_remainder = "0", steps - hits
 
-        # Remaining groups become the new remainder
-        if groups:
-            remainder = groups
-        groups = new_groups
+    while n_remainder > 1:
+        # Pair each group with a remainder; unpaired ones become the remainder
+        paired = group + remainder
+        if n_groups > n_remainder:
+            n_groups, n_remainder = n_remainder, n_groups - n_remainder
+            remainder = group
+        else:
+            n_remainder -= n_groups
+        group = paired
 
-    # Flatten
-    result = []
-    for g in groups + remainder:
-        result.extend(g)
-    return result
+    # Step 0 is the first character, so reverse to make it the lowest bit
+    return int((group * n_groups + remainder * n_remainder)[::-1], 2)
 
 
 def probability_seq(
@@ -369,6 +488,7 @@ def probability_seq(
     probability: float = 0.7,
     duration: int | None = None,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Seq:
     """Generate a sequence where each step has a probability of being a note.
 
@@ -378,6 +498,8 @@ def probability_seq(
         probability: Probability (0-1) that each step contains a note vs rest.
         duration: Duration for notes and rests.
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A Seq with notes and rests based on probability.
@@ -391,16 +513,16 @@ def probability_seq(
     if not 0 <= probability <= 1:
         raise ValueError("probability must be between 0 and 1")
 
-    rng = random.Random(seed)
-    elements = []
-
-    for _ in range(length):
-        if rng.random() < probability:
-            pitch = rng.choice(notes)
-            elements.append(note(pitch, duration=duration))
-        else:
-            elements.append(rest(duration=duration))
+    rng = _get_rng(seed, rng)
+    random_ = rng.random
+    choice = rng.choice
+    silence = _rest(duration)
 
+    # The pitch is only drawn for hits, same as an explicit if/else
+    elements: list[ComposeElement] = [
+        note(choice(notes), duration=duration) if random_() < probability else silence
+        for _ in range(length)
+    ]
     return Seq(elements=elements)
 
 
@@ -409,6 +531,7 @@ def rest_probability(
     probability: float = 0.2,
     *,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Seq:
     """Replace some notes in a sequence with rests based on probability.
 
@@ -416,6 +539,8 @@ def rest_probability(
         sequence: The input sequence.
         probability: Probability (0-1) that each note becomes a rest.
         seed: Optional random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A new Seq with some notes replaced by rests.
@@ -427,18 +552,18 @@ def rest_probability(
     if not 0 <= probability <= 1:
         raise ValueError("probability must be between 0 and 1")
 
-    rng = random.Random(seed)
-    elements = []
+    if probability == 0:
+        return Seq(elements=list(sequence.elements))
 
-    for elem in sequence.elements:
-        if isinstance(elem, Note) and rng.random() < probability:
-            # Replace note with rest of same duration
-            elements.append(
-                rest(duration=elem.duration, ms=elem.ms, seconds=elem.seconds)
-            )
-        else:
-            elements.append(elem)
+    random_ = _get_rng(seed, rng).random
 
+    # Replace notes with rests of the same duration
+    elements = [
+        _rest(elem.duration, elem.ms, elem.seconds)
+        if isinstance(elem, Note) and random_() < probability
+        else elem
+        for elem in sequence.elements
+    ]
     return Seq(elements=elements)
 
 
@@ -476,6 +601,7 @@ class MarkovChain:
         *,
         duration: int | None = None,
         seed: int | None = None,
+        rng: random.Random | None = None,
     ) -> Seq:
         """Generate a sequence using the Markov chain.
 
@@ -484,6 +610,8 @@ class MarkovChain:
             length: Number of notes to generate.
             duration: Duration for all generated notes.
             seed: Optional random seed for reproducibility.
+            rng: Optional random.Random instance to draw from instead of
+                seeding a new one (e.g. to share one generator across calls).
 
         Returns:
             A Seq of generated notes.
@@ -498,7 +626,7 @@ class MarkovChain:
         if not self.transitions:
             raise ValueError("Markov chain has no transitions defined")
 
-        rng = random.Random(seed)
+        rng = _get_rng(seed, rng)
 
         # Choose starting state
         if start is None:
@@ -507,27 +635,60 @@ class MarkovChain:
             # If start state has no transitions, pick a random one
             start = rng.choice(list(self.transitions.keys()))
 
-        elements = [note(start, duration=duration)]
-        current = start
+        table = self._compile()
+        path = _markov_walk(rng, table, table.state_id[start], length)
+        return Seq(elements=[note(table.states[i], duration=duration) for i in path])
 
-        for _ in range(length - 1):
-            if current not in self.transitions:
-                # Dead end - pick random state
-                current = rng.choice(list(self.transitions.keys()))
+    def _compile(self) -> _MarkovTable:
+        """Flatten the transitions into CSR-style parallel lists.
 
-            trans = self.transitions[current]
-            if not trans:
-                current = rng.choice(list(self.transitions.keys()))
-                elements.append(note(current, duration=duration))
-                continue
+        Source states get ids 0..n_sources-1 in insertion order, followed by
+        states that only ever appear as targets (dead ends).
+        """
+        states = list(self.transitions)
+        state_id = {state: i for i, state in enumerate(states)}
+        for trans in self.transitions.values():
+            for target in trans:
+                if target not in state_id:
+                    state_id[target] = len(states)
+                    states.append(target)
+
+        row_ptr = [0]
+        next_state: list[int] = []
+        cum_weight: list[float] = []
+        for state, trans in self.transitions.items():
+            next_state.extend(state_id[target] for target in trans)
+            cum_weight.extend(accumulate(trans.values()))
+            if trans and cum_weight[-1] <= 0:
+                raise ValueError(
+                    f"total transition weight from {state!r} must be greater than zero"
+                )
+            row_ptr.append(len(next_state))
 
-            # Weighted random choice for next state
-            states = list(trans.keys())
-            weights = list(trans.values())
-            current = rng.choices(states, weights=weights, k=1)[0]
-            elements.append(note(current, duration=duration))
+        return _MarkovTable(
+            states=states,
+            state_id=state_id,
+            n_sources=len(self.transitions),
+            row_ptr=row_ptr,
+            next_state=next_state,
+            cum_weight=cum_weight,
+        )
 
-        return Seq(elements=elements)
+
+@dataclass
+class _MarkovTable:
+    """Compiled transition table for MarkovChain.
+
+    Row ``i`` spans ``row_ptr[i]:row_ptr[i + 1]`` of ``next_state`` and
+    ``cum_weight``; the weights are prefix sums restarting at each row.
+    """
+
+    states: list[str]
+    state_id: dict[str, int]
+    n_sources: int
+    row_ptr: list[int]
+    next_state: list[int]
+    cum_weight: list[float]
 
 
 def markov_chain(transitions: dict[str, dict[str, float]]) -> MarkovChain:
@@ -655,56 +816,57 @@ def lsystem(
     if iterations < 0:
         raise ValueError("iterations must be non-negative")
 
-    # Expand the L-system
+    # Expand the L-system. Only single-character symbols can ever match, and
+    # str.translate rewrites every character in one C-level pass.
+    table = str.maketrans({k: v for k, v in rules.items() if len(k) == 1})
     current = axiom
     for _ in range(iterations):
-        next_str = ""
-        for char in current:
-            next_str += rules.get(char, char)
-        current = next_str
-
-    # Convert to notes
-    elements = []
-    for char in current:
+        current = current.translate(table)
+
+    # Copy each symbol's note/rest once, then look it up per character
+    default_elem: ComposeElement | None = None
+    if isinstance(default, Note):
+        default_elem = note(
+            default.pitch,
+            duration=default.duration,
+            octave=default.octave,
+            accidental=default.accidental,
+        )
+    elif isinstance(default, Rest):
+        default_elem = rest(duration=default.duration)
+
+    symbol_elems: dict[str, ComposeElement | None] = {}
+    for char in set(current):
         if char in note_map:
-            # Create a copy of the note/rest
-            elem = note_map[char]
-            if isinstance(elem, Note):
-                elements.append(
-                    note(
-                        elem.pitch,
-                        duration=elem.duration,
-                        octave=elem.octave,
-                        accidental=elem.accidental,
-                        dots=elem.dots,
-                        ms=elem.ms,
-                        seconds=elem.seconds,
-                        slurred=elem.slurred,
-                    )
-                )
-            elif isinstance(elem, Rest):
-                elements.append(
-                    rest(
-                        duration=elem.duration,
-                        dots=elem.dots,
-                        ms=elem.ms,
-                        seconds=elem.seconds,
-                    )
-                )
-        elif default is not None:
-            if isinstance(default, Note):
-                elements.append(
-                    note(
-                        default.pitch,
-                        duration=default.duration,
-                        octave=default.octave,
-                        accidental=default.accidental,
-                    )
-                )
-            elif isinstance(default, Rest):
-                elements.append(rest(duration=default.duration))
-
-    return Seq(elements=elements)
+            symbol_elems[char] = _copy_element(note_map[char])
+        else:
+            symbol_elems[char] = default_elem
+
+    elements = [symbol_elems[char] for char in current]
+    return Seq(elements=[elem for elem in elements if elem is not None])
+
+
+def _copy_element(elem: Note | Rest) -> ComposeElement | None:
+    """Copy an L-system note_map entry (anything else maps to nothing)."""
+    if isinstance(elem, Note):
+        return note(
+            elem.pitch,
+            duration=elem.duration,
+            octave=elem.octave,
+            accidental=elem.accidental,
+            dots=elem.dots,
+            ms=elem.ms,
+            seconds=elem.seconds,
+            slurred=elem.slurred,
+        )
+    if isinstance(elem, Rest):
+        return rest(
+            duration=elem.duration,
+            dots=elem.dots,
+            ms=elem.ms,
+            seconds=elem.seconds,
+        )
+    return None
 
 
 # =============================================================================
@@ -750,47 +912,58 @@ def cellular_automaton(
     if width < 1 or steps < 1:
         raise ValueError("width and steps must be positive")
 
-    # Parse rule into lookup table
-    rule_table = [(rule >> i) & 1 for i in range(8)]
+    # Neighborhoods (left, center, right as a 3-bit index) that turn a cell on
+    minterms = [idx for idx in range(8) if (rule >> idx) & 1]
 
-    # Initialize state
+    # Pack each row into an int bitboard: bit i holds cell i
     if initial is not None:
         if len(initial) != width:
             raise ValueError(f"initial must have length {width}")
-        state = list(initial)
+        row = sum(1 << i for i, cell in enumerate(initial) if cell)
     else:
-        state = [False] * width
-        state[width // 2] = True
+        row = 1 << (width // 2)
 
+    # Convert rows to notes (on) and rests (off)
     elements = []
-
-    for _ in range(steps):
-        # Convert current row to notes
-        for cell in state:
-            if cell:
+    for row in _ca_rows(minterms, row, width, steps, wrap):
+        for i in range(width):
+            if (row >> i) & 1:
                 elements.append(note(pitch_on, duration=duration))
             else:
-                elements.append(rest(duration=duration))
+                elements.append(_rest(duration))
 
-        # Compute next state
-        new_state = []
-        for i in range(width):
-            if wrap:
-                left = state[(i - 1) % width]
-                center = state[i]
-                right = state[(i + 1) % width]
-            else:
-                left = state[i - 1] if i > 0 else False
-                center = state[i]
-                right = state[i + 1] if i < width - 1 else False
+    return Seq(elements=elements)
 
-            # Compute neighborhood index
-            idx = (int(left) << 2) | (int(center) << 1) | int(right)
-            new_state.append(bool(rule_table[idx]))
 
-        state = new_state
+def _ca_rows(
+    minterms: list[int], row: int, width: int, steps: int, wrap: bool
+) -> list[int]:
+    """Run an elementary cellular automaton, returning each row as a bitboard."""
+    full = (1 << width) - 1
+    top = width - 1
 
-    return Seq(elements=elements)
+    rows = []
+    for _ in range(steps):
+        rows.append(row)
+
+        # Align every cell's left and right neighbors with the cell itself,
+        # then evaluate the rule for the whole row at once
+        left = (row << 1) & full
+        right = row >> 1
+        if wrap:
+            left |= row >> top
+            right |= (row & 1) << top
+
+        new_row = 0
+        for idx in minterms:
+            new_row |= (
+                (left if idx & 4 else ~left)
+                & (row if idx & 2 else ~row)
+                & (right if idx & 1 else ~right)
+            )
+        row = new_row & full
+
+    return rows
 
 
 # =============================================================================
@@ -844,80 +1017,163 @@ def shift_register(
         >>> # Custom taps for different pattern
         >>> shift_register(16, taps=[0, 2, 3, 5], bits=8)
     """
-    if bits < 1 or bits > 16:
-        raise ValueError("bits must be between 1 and 16")
     if length < 1:
         raise ValueError("length must be positive")
 
-    # Default maximal-length LFSR taps (produces longest cycle before repeating)
-    default_taps: dict[int, list[int]] = {
-        1: [0],
-        2: [0, 1],
-        3: [0, 2],
-        4: [0, 3],
-        5: [1, 4],
-        6: [0, 5],
-        7: [0, 6],
-        8: [1, 2, 3, 7],  # x^8 + x^4 + x^3 + x^2 + 1
-        9: [3, 8],
-        10: [2, 9],
-        11: [1, 10],
-        12: [0, 3, 5, 11],
-        13: [0, 2, 3, 12],
-        14: [0, 2, 4, 13],
-        15: [0, 14],
-        16: [1, 2, 4, 15],
-    }
+    lfsr = LFSR(bits, taps, initial=initial)
+    return lfsr.generate(length, scale=scale, duration=duration, mode=mode)
+
+
+class LFSR:
+    """A stateful Linear Feedback Shift Register.
+
+    Unlike shift_register(), which starts from ``initial`` on every call,
+    an LFSR keeps its register between calls so successive patterns carry
+    on from where the previous one stopped.
+
+    Examples:
+        >>> lfsr = LFSR(bits=4)
+        >>> verse = lfsr.generate(8, scale=["c", "e", "g", "b"])
+        >>> chorus = lfsr.generate(8, scale=["c", "e", "g", "b"])  # continues
+    """
+
+    def __init__(
+        self,
+        bits: int = 8,
+        taps: list[int] | None = None,
+        *,
+        initial: int | None = None,
+    ):
+        """Initialize a shift register.
+
+        Args:
+            bits: Size of the shift register in bits (1-16).
+            taps: Bit positions to XOR for feedback (0-indexed from LSB).
+                If None, uses maximal-length taps for the given bit size.
+            initial: Initial register value. If None, starts at 1.
+        """
+        self.bits = bits
+        self.tap_mask = _lfsr_config(bits, None if taps is None else tuple(taps))
+
+        max_val = (1 << bits) - 1
+        if initial is None:
+            self.register = 1  # Can't start at 0 (would stay 0)
+        else:
+            self.register = initial & max_val
+            if self.register == 0:
+                self.register = 1  # Prevent stuck state
+
+    def states(self, length: int) -> list[int]:
+        """Return the next ``length`` register values and advance past them.
+
+        Like shift_register(), ``length`` must be at least 1.
+        """
+        if length < 1:
+            raise ValueError("length must be positive")
+
+        registers = _lfsr_states(self.register, self.tap_mask, self.bits, length + 1)
+        self.register = registers.pop()
+        return registers
+
+    def generate(
+        self,
+        length: int,
+        *,
+        scale: list[str] | None = None,
+        duration: int | None = None,
+        mode: str = "pitch",
+    ) -> Seq:
+        """Generate the next ``length`` steps as a sequence.
+
+        Args:
+            length: Number of notes to generate.
+            scale: List of pitches to map register values to. If None, uses
+                the C major scale.
+            duration: Duration for each note.
+            mode: Output mode, as for shift_register().
+
+        Returns:
+            A Seq of notes based on the shift register output.
+        """
+        # Default scale (C major - chromatic would require accidental handling)
+        if scale is None:
+            scale = ["c", "d", "e", "f", "g", "a", "b"]
+
+        registers = self.states(length)
+
+        elements: list[ComposeElement]
+        if mode == "binary":
+            # Output based on LSB
+            hit, silence = note(scale[0], duration=duration), _rest(duration)
+            elements = [hit if reg & 1 else silence for reg in registers]
+        else:
+            # "pitch" maps the register value to the scale. "velocity" uses the
+            # same pitch mapping; actual velocity would be applied via MIDI
+            # transform post-generation.
+            degrees = _scale_notes(scale, duration)
+            n = len(degrees)
+            elements = [degrees[reg % n] for reg in registers]
+
+        return Seq(elements=elements)
+
+
+# Default maximal-length LFSR taps (produces longest cycle before repeating)
+_DEFAULT_TAPS: dict[int, tuple[int, ...]] = {
+    1: (0,),
+    2: (0, 1),
+    3: (0, 2),
+    4: (0, 3),
+    5: (1, 4),
+    6: (0, 5),
+    7: (0, 6),
+    8: (1, 2, 3, 7),  # x^8 + x^4 + x^3 + x^2 + 1
+    9: (3, 8),
+    10: (2, 9),
+    11: (1, 10),
+    12: (0, 3, 5, 11),
+    13: (0, 2, 3, 12),
+    14: (0, 2, 4, 13),
+    15: (0, 14),
+    16: (1, 2, 4, 15),
+}
+
+
+@lru_cache(maxsize=128)
+def _lfsr_config(bits: int, taps: tuple[int, ...] | None) -> int:
+    """Validate a register size and tap set, returning the feedback tap mask."""
+    if bits < 1 or bits > 16:
+        raise ValueError("bits must be between 1 and 16")
 
     if taps is None:
-        taps = default_taps.get(bits, [0, bits - 1])
+        taps = _DEFAULT_TAPS[bits]
 
-    # Validate taps
     for tap in taps:
         if tap < 0 or tap >= bits:
             raise ValueError(f"tap {tap} is out of range for {bits}-bit register")
 
-    # Default scale (C major - chromatic would require accidental handling)
-    if scale is None:
-        scale = ["c", "d", "e", "f", "g", "a", "b"]
+    tap_mask = 0
+    for tap in taps:
+        # XOR-ing a tap twice cancels it out
+        tap_mask ^= 1 << tap
+    return tap_mask
 
-    # Initialize register
-    max_val = (1 << bits) - 1
-    if initial is None:
-        register = 1  # Can't start at 0 (would stay 0)
-    else:
-        register = initial & max_val
-        if register == 0:
-            register = 1  # Prevent stuck state
 
-    elements: list[ComposeElement] = []
+def _lfsr_states(register: int, tap_mask: int, bits: int, length: int) -> list[int]:
+    """Step a Fibonacci LFSR, returning the register value before each shift."""
+    max_val = (1 << bits) - 1
+    msb = bits - 1
 
+    registers = []
     for _ in range(length):
-        if mode == "binary":
-            # Output based on LSB
-            if register & 1:
-                elements.append(note(scale[0], duration=duration))
-            else:
-                elements.append(rest(duration=duration))
-        elif mode == "velocity":
-            # Map register to scale (velocity mode uses same pitch mapping,
-            # actual velocity would be applied via MIDI transform post-generation)
-            scale_idx = register % len(scale)
-            elements.append(note(scale[scale_idx], duration=duration))
-        else:  # mode == "pitch"
-            # Map register value to scale
-            scale_idx = register % len(scale)
-            elements.append(note(scale[scale_idx], duration=duration))
-
-        # Compute feedback (XOR of tap positions)
-        feedback = 0
-        for tap in taps:
-            feedback ^= (register >> tap) & 1
+        registers.append(register)
+
+        # Compute feedback (XOR of tap positions == parity of tapped bits)
+        feedback = (register & tap_mask).bit_count() & 1
 
         # Shift register and insert feedback at MSB
-        register = ((register >> 1) | (feedback << (bits - 1))) & max_val
+        register = ((register >> 1) | (feedback << msb)) & max_val
 
-    return Seq(elements=elements)
+    return registers
 
 
 def turing_machine(
@@ -929,6 +1185,7 @@ def turing_machine(
     duration: int | None = None,
     initial: int | None = None,
     seed: int | None = None,
+    rng: random.Random | None = None,
 ) -> Seq:
     """Generate a sequence using a Turing Machine-style shift register.
 
@@ -946,6 +1203,8 @@ def turing_machine(
         duration: Duration for each note.
         initial: Initial register value. If None, random.
         seed: Random seed for reproducibility.
+        rng: Optional random.Random instance to draw from instead of
+            seeding a new one (e.g. to share one generator across calls).
 
     Returns:
         A Seq of notes based on the Turing Machine output.
@@ -967,7 +1226,7 @@ def turing_machine(
     if not 0 <= probability <= 1:
         raise ValueError("probability must be between 0 and 1")
 
-    rng = random.Random(seed)
+    rng = _get_rng(seed, rng)
 
     # Default to pentatonic scale
     if scale is None:
@@ -982,24 +1241,37 @@ def turing_machine(
         if register == 0:
             register = 1
 
-    elements: list[ComposeElement] = []
+    registers = _turing_states(register, bits, length, rng, probability)
 
-    for _ in range(length):
-        # Map register to scale
-        scale_idx = register % len(scale)
-        elements.append(note(scale[scale_idx], duration=duration))
+    # Map register to scale
+    degrees = _scale_notes(scale, duration)
+    n = len(degrees)
+    return Seq(elements=[degrees[reg % n] for reg in registers])
+
+
+def _turing_states(
+    register: int, bits: int, length: int, rng: random.Random, probability: float
+) -> list[int]:
+    """Rotate a register with random bit flips, returning each value before shifting."""
+    max_val = (1 << bits) - 1
+    msb = bits - 1
+
+    # One draw per step regardless of outcome, so pre-drawing the coin
+    # flips consumes the stream exactly as drawing them in the loop would
+    random_ = rng.random
+    flips = [random_() < probability for _ in range(length)]
 
-        # Get the bit that's about to be shifted out
-        lsb = register & 1
+    registers = []
+    for flip in flips:
+        registers.append(register)
 
-        # Maybe flip it
-        if rng.random() < probability:
-            lsb ^= 1
+        # Get the bit that's about to be shifted out, maybe flipping it
+        lsb = (register & 1) ^ flip
 
         # Shift and insert (possibly flipped) bit at MSB
-        register = ((register >> 1) | (lsb << (bits - 1))) & max_val
+        register = ((register >> 1) | (lsb << msb)) & max_val
 
-    return Seq(elements=elements)
+    return registers
 
 
 # =============================================================================
@@ -1007,6 +1279,104 @@ def turing_machine(
 # =============================================================================
 
 
+def _markov_walk(
+    rng: random.Random, table: _MarkovTable, start: int, length: int
+) -> list[int]:
+    """Walk a compiled Markov chain, returning visited state ids (incl. start)."""
+    n_sources = table.n_sources
+    sources = range(n_sources)
+    row_ptr = table.row_ptr
+    next_state = table.next_state
+    cum_weight = table.cum_weight
+    random_ = rng.random
+
+    path = [start]
+    current = start
+
+    for _ in range(length - 1):
+        if current >= n_sources:
+            # Dead end - pick random state
+            current = rng.choice(sources)
+
+        lo = row_ptr[current]
+        hi = row_ptr[current + 1]
+        if lo == hi:
+            current = rng.choice(sources)
+        else:
+            # Weighted random choice for next state
+            r = random_() * cum_weight[hi - 1]
+            current = next_state[bisect(cum_weight, r, lo, hi - 1)]
+        path.append(current)
+
+    return path
+
+
+def _scale_notes(scale: list[str], duration: int | None) -> list[Note]:
+    """Build one note per scale degree for register-to-pitch lookup.
+
+    Note is frozen, so the same instance can stand for every step that
+    lands on a given degree.
+    """
+    return [note(pitch, duration=duration) for pitch in scale]
+
+
+@lru_cache(maxsize=128, typed=True)
+def _rest(
+    duration: int | None, ms: float | None = None, seconds: float | None = None
+) -> Rest:
+    """Return a shared rest for the given length.
+
+    Rest is a frozen dataclass, so generators can reuse one instance per
+    length instead of allocating a new rest for every silent step.
+    """
+    return rest(duration=duration, ms=ms, seconds=seconds)
+
+
+def _get_rng(seed: int | None, rng: random.Random | None) -> random.Random:
+    """Return the caller's generator, or a new one seeded with ``seed``."""
+    if rng is not None:
+        return rng
+    return random.Random(seed)
+
+
+def _validate_weights(
+    weighted_options: list[tuple[T, float]],
+) -> tuple[list[T], list[float], float]:
+    """Validate (item, weight) pairs, returning the items, weights and total."""
+    if not weighted_options:
+        raise ValueError("weighted_options list cannot be empty")
+
+    items = [item for item, _ in weighted_options]
+    weights = [weight for _, weight in weighted_options]
+
+    if any(w < 0 for w in weights):
+        raise ValueError("weights cannot be negative")
+
+    total = sum(weights)
+    if total == 0:
+        raise ValueError("total weight cannot be zero")
+
+    return items, weights, total
+
+
+def _cumulative_weights(
+    weighted_options: list[tuple[T, float]],
+) -> tuple[list[T], list[float]]:
+    """Validate (item, weight) pairs and split them into items and prefix sums."""
+    items, weights, _ = _validate_weights(weighted_options)
+    return items, list(accumulate(weights))
+
+
+def _weighted_index(rng: random.Random, cum_weights: list[float]) -> int:
+    """Pick an index by binary search over cumulative weights.
+
+    Draws exactly as ``rng.choices(population, cum_weights=cum_weights)``
+    does, so seeded output is unchanged.
+    """
+    hi = len(cum_weights) - 1
+    return bisect(cum_weights, rng.random() * cum_weights[-1], 0, hi)
+
+
 def _midi_to_note(midi_pitch: int, *, duration: int | None = None) -> Note:
     """Convert a MIDI pitch number to a Note.
 
@@ -1017,15 +1387,11 @@ def _midi_to_note(midi_pitch: int, *, duration: int | None = None) -> Note:
     Returns:
         A Note with the appropriate pitch and octave.
     """
-    pitch_names = ["c", "c", "d", "d", "e", "f", "f", "g", "g", "a", "a", "b"]
-    accidentals = [None, "+", None, "+", None, None, "+", None, "+", None, "+", None]
-
-    pitch_class = midi_pitch % 12
-    octave = (midi_pitch // 12) - 1
+    octave, pitch_class = divmod(midi_pitch, 12)
 
-    return note(
-        pitch_names[pitch_class],
+    return Note(
+        pitch=_SEMITONE_TO_PITCH[pitch_class],
         duration=duration,
-        octave=octave,
-        accidental=accidentals[pitch_class],
+        octave=octave - 1,
+        accidental=_SEMITONE_ACCIDENTALS[pitch_class] or None,
     )
@@ -6,7 +6,9 @@ making it easy to generate melodies within specific tonal contexts.
 
 from __future__ import annotations
 
-from .core import Seq, note
+from functools import lru_cache
+
+from .core import Note, Seq, note
 
 # =============================================================================
 # Scale Definitions
@@ -77,6 +79,41 @@ OFFSET_TO_PITCH: list[tuple[str, str | None]] = [
     ("b", None),
 ]
 
+# Offset to full pitch name (e.g. 1 -> "c+")
+_PITCH_NAMES: tuple[str, ...] = tuple(
+    f"{pitch}{accidental or ''}" for pitch, accidental in OFFSET_TO_PITCH
+)
+
+# Relative minor/major root names indexed by the other key's root offset
+_RELATIVE_MINOR: tuple[str, ...] = tuple(_PITCH_NAMES[(i - 3) % 12] for i in range(12))
+_RELATIVE_MAJOR: tuple[str, ...] = tuple(_PITCH_NAMES[(i + 3) % 12] for i in range(12))
+
+# Interval names indexed by size in semitones (0-12)
+_INTERVAL_NAMES: tuple[str, ...] = (
+    "unison",
+    "minor second",
+    "major second",
+    "minor third",
+    "major third",
+    "perfect fourth",
+    "tritone",
+    "perfect fifth",
+    "minor sixth",
+    "major sixth",
+    "minor seventh",
+    "major seventh",
+    "octave",
+)
+
+
+@lru_cache(maxsize=256)
+def _pitch_offset(pitch: str) -> int:
+    """Pitch class (0-11) of a pitch name such as "c", "f+" or "b-"."""
+    if len(pitch) > 1 and pitch[1] in "+-":
+        offset = PITCH_TO_OFFSET[pitch[0].lower()]
+        return (offset + 1 if pitch[1] == "+" else offset - 1) % 12
+    return PITCH_TO_OFFSET[pitch.lower()]
+
 
 # =============================================================================
 # Scale Functions
@@ -109,27 +146,31 @@ def scale(
         >>> scale("c", "pentatonic")
         ['c', 'd', 'e', 'g', 'a']
     """
-    if scale_type not in SCALE_INTERVALS:
+    return list(_scale_pitches(*_resolve_scale(root, scale_type)))
+
+
+def _resolve_scale(root: str, scale_type: str) -> tuple[int, tuple[int, ...]]:
+    """Validate a root and scale type, returning (root offset, intervals)."""
+    intervals = SCALE_INTERVALS.get(scale_type)
+    if intervals is None:
         available = ", ".join(sorted(SCALE_INTERVALS.keys()))
         raise ValueError(f"Unknown scale type: {scale_type}. Available: {available}")
 
-    root_lower = root.lower()
-    if root_lower not in PITCH_TO_OFFSET:
+    root_offset = PITCH_TO_OFFSET.get(root.lower())
+    if root_offset is None:
         raise ValueError(f"Invalid root note: {root}")
 
-    root_offset = PITCH_TO_OFFSET[root_lower]
-    intervals = SCALE_INTERVALS[scale_type]
+    return root_offset, tuple(intervals)
 
-    pitches = []
-    for interval in intervals:
-        pitch_offset = (root_offset + interval) % 12
-        pitch_name, accidental = OFFSET_TO_PITCH[pitch_offset]
-        if accidental:
-            pitches.append(f"{pitch_name}{accidental}")
-        else:
-            pitches.append(pitch_name)
 
-    return pitches
+@lru_cache(maxsize=256)
+def _scale_pitches(root_offset: int, intervals: tuple[int, ...]) -> tuple[str, ...]:
+    """Pitch names for a scale.
+
+    Keyed on the intervals themselves rather than the scale name, so scales
+    added to or changed in SCALE_INTERVALS are never served stale.
+    """
+    return tuple(_PITCH_NAMES[(root_offset + interval) % 12] for interval in intervals)
 
 
 def scale_notes(
@@ -156,40 +197,41 @@ def scale_notes(
         >>> scale_notes("c", "major", duration=8)
         >>> scale_notes("a", "minor", octave=5, ascending=False)
     """
-    pitches = scale(root, scale_type)
-
+    notes = _scale_notes(*_resolve_scale(root, scale_type), octave, duration)
+    return Seq(elements=list(notes) if ascending else list(reversed(notes)))
+
+
+@lru_cache(maxsize=256, typed=True)
+def _scale_notes(
+    root_offset: int,
+    intervals: tuple[int, ...],
+    octave: int,
+    duration: int | None,
+) -> tuple[Note, ...]:
+    """Ascending notes of a scale; Note is frozen, so calls share them."""
     notes = []
     current_octave = octave
+    previous_letter = None
+
+    for interval in intervals:
+        pitch, accidental = OFFSET_TO_PITCH[(root_offset + interval) % 12]
 
-    for i, pitch in enumerate(pitches):
-        # Handle accidentals in pitch name
-        if len(pitch) > 1 and pitch[1] in "+-":
-            base_pitch = pitch[0]
-            accidental = pitch[1]
-        else:
-            base_pitch = pitch
-            accidental = None
-
-        # Check if we need to go up an octave
-        if i > 0:
-            prev_pitch = pitches[i - 1][0].lower()
-            curr_pitch = base_pitch.lower()
-            if PITCH_TO_OFFSET.get(curr_pitch, 0) < PITCH_TO_OFFSET.get(prev_pitch, 0):
-                current_octave += 1
+        # Go up an octave whenever the letter wraps past b
+        letter_offset = PITCH_TO_OFFSET[pitch]
+        if previous_letter is not None and letter_offset < previous_letter:
+            current_octave += 1
+        previous_letter = letter_offset
 
         notes.append(
             note(
-                base_pitch,
+                pitch,
                 duration=duration,
                 octave=current_octave,
                 accidental=accidental,
             )
         )
 
-    if not ascending:
-        notes = list(reversed(notes))
-
-    return Seq(elements=notes)
+    return tuple(notes)
 
 
 def scale_degree(
@@ -221,22 +263,10 @@ def scale_degree(
     if degree < 1:
         raise ValueError("Scale degree must be >= 1")
 
-    pitches = scale(root, scale_type)
-    scale_len = len(pitches)
-
-    # Calculate octave offset and index
-    octave_offset = (degree - 1) // scale_len
-    index = (degree - 1) % scale_len
-
-    pitch = pitches[index]
-    if len(pitch) > 1 and pitch[1] in "+-":
-        base_pitch = pitch[0]
-        accidental: str | None = pitch[1]
-    else:
-        base_pitch = pitch
-        accidental = None
-
-    return base_pitch, accidental, octave + octave_offset
+    root_offset, intervals = _resolve_scale(root, scale_type)
+    octave_offset, index = divmod(degree - 1, len(intervals))
+    pitch, accidental = OFFSET_TO_PITCH[(root_offset + intervals[index]) % 12]
+    return pitch, accidental, octave + octave_offset
 
 
 def mode(
@@ -281,12 +311,7 @@ def relative_minor(major_root: str) -> str:
         >>> relative_minor("g")  # G major -> E minor
         'e'
     """
-    root_offset = PITCH_TO_OFFSET[major_root.lower()]
-    minor_offset = (root_offset - 3) % 12
-    pitch, accidental = OFFSET_TO_PITCH[minor_offset]
-    if accidental:
-        return f"{pitch}{accidental}"
-    return pitch
+    return _RELATIVE_MINOR[PITCH_TO_OFFSET[major_root.lower()]]
 
 
 def relative_major(minor_root: str) -> str:
@@ -304,24 +329,7 @@ def relative_major(minor_root: str) -> str:
         >>> relative_major("e")  # E minor -> G major
         'g'
     """
-    # Handle accidentals
-    if len(minor_root) > 1 and minor_root[1] in "+-":
-        base = minor_root[0].lower()
-        acc = minor_root[1]
-        root_offset = PITCH_TO_OFFSET[base]
-        if acc == "+":
-            root_offset += 1
-        elif acc == "-":
-            root_offset -= 1
-        root_offset = root_offset % 12
-    else:
-        root_offset = PITCH_TO_OFFSET[minor_root.lower()]
-
-    major_offset = (root_offset + 3) % 12
-    pitch, accidental = OFFSET_TO_PITCH[major_offset]
-    if accidental:
-        return f"{pitch}{accidental}"
-    return pitch
+    return _RELATIVE_MAJOR[_pitch_offset(minor_root)]
 
 
 def parallel_minor(major_root: str) -> str:
@@ -373,29 +381,7 @@ def transpose_scale(
         >>> transpose_scale(["c", "d", "e"], 5)  # Up a fourth
         ['f', 'g', 'a']
     """
-    result = []
-    for pitch in pitches:
-        # Parse pitch
-        if len(pitch) > 1 and pitch[1] in "+-":
-            base = pitch[0].lower()
-            acc = pitch[1]
-            offset = PITCH_TO_OFFSET[base]
-            if acc == "+":
-                offset += 1
-            elif acc == "-":
-                offset -= 1
-        else:
-            offset = PITCH_TO_OFFSET[pitch.lower()]
-
-        # Transpose
-        new_offset = (offset + semitones) % 12
-        new_pitch, new_acc = OFFSET_TO_PITCH[new_offset]
-        if new_acc:
-            result.append(f"{new_pitch}{new_acc}")
-        else:
-            result.append(new_pitch)
-
-    return result
+    return [_PITCH_NAMES[(_pitch_offset(pitch) + semitones) % 12] for pitch in pitches]
 
 
 def interval_name(semitones: int) -> str:
@@ -413,23 +399,7 @@ def interval_name(semitones: int) -> str:
         >>> interval_name(7)
         'perfect fifth'
     """
-    names = {
-        0: "unison",
-        1: "minor second",
-        2: "major second",
-        3: "minor third",
-        4: "major third",
-        5: "perfect fourth",
-        6: "tritone",
-        7: "perfect fifth",
-        8: "minor sixth",
-        9: "major sixth",
-        10: "minor seventh",
-        11: "major seventh",
-        12: "octave",
-    }
-    semitones = semitones % 13
-    return names.get(semitones, f"{semitones} semitones")
+    return _INTERVAL_NAMES[semitones % 13]
 
 
 def list_scales() -> list[str]:
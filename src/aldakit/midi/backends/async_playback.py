@@ -94,6 +94,8 @@ class AsyncPlaybackManager:
 
         self._slots = [PlaybackSlot(slot_id=i) for i in range(MAX_PLAYBACK_SLOTS)]
         self._lock = threading.Lock()
+        # Notified (under _lock) whenever a slot finishes playing
+        self._slot_done = threading.Condition(self._lock)
         self._concurrent_mode = True
         self._shutdown = False
 
@@ -206,11 +208,12 @@ class AsyncPlaybackManager:
                     self._send_control_change(*event.args)
 
         finally:
-            with self._lock:
+            with self._slot_done:
                 slot.active = False
                 slot.events = []
                 slot.event_index = 0
                 slot.stop_requested = False
+                self._slot_done.notify_all()
 
     def play(self, sequence: MidiSequence) -> int | None:
         """Start playing a MIDI sequence asynchronously.
@@ -229,8 +232,7 @@ class AsyncPlaybackManager:
 
         # In sequential mode, wait for all playback to complete
         if not self._concurrent_mode:
-            while self.is_playing():
-                time.sleep(SEQUENTIAL_MODE_SLEEP)
+            self.wait(SEQUENTIAL_MODE_SLEEP)
 
         # Find a free slot
         slot = self._find_free_slot()
@@ -290,11 +292,16 @@ class AsyncPlaybackManager:
     def wait(self, poll_interval: float = POLL_INTERVAL_DEFAULT) -> None:
         """Block until all playback completes.
 
+        Slot threads signal when they finish, so this returns as soon as the
+        last one is done rather than on the next poll tick.
+
         Args:
-            poll_interval: Seconds between status checks.
+            poll_interval: Maximum seconds between status checks (keeps the
+                wait interruptible).
         """
-        while self.is_playing():
-            time.sleep(poll_interval)
+        with self._slot_done:
+            while any(slot.active for slot in self._slots):
+                self._slot_done.wait(poll_interval)
 
     def shutdown(self) -> None:
         """Shutdown the playback manager, stopping all playback."""
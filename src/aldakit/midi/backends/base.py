@@ -11,8 +11,13 @@ class MidiBackend(ABC):
 
     Backends may support concurrent playback mode, where multiple
     sequences can play simultaneously (up to a backend-specific limit).
+
+    The base class declares no instance state, so subclasses that define
+    ``__slots__`` get instances without a per-instance ``__dict__``.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def play(self, sequence: MidiSequence) -> int | None:
         """Play a MIDI sequence in realtime.
@@ -207,47 +207,44 @@ class MidiGenerator:
 
     def _process_node(self, node: ASTNode) -> None:
         """Process an AST node."""
-        if isinstance(node, PartNode):
-            self._process_part(node)
-        elif isinstance(node, EventSequenceNode):
-            self._process_event_sequence(node)
-        elif isinstance(node, NoteNode):
-            self._process_note(node)
-        elif isinstance(node, RestNode):
-            self._process_rest(node)
-        elif isinstance(node, ChordNode):
-            self._process_chord(node)
-        elif isinstance(node, OctaveSetNode):
-            for part in self._get_all_part_states():
-                part.octave = node.octave
-        elif isinstance(node, OctaveUpNode):
-            for part in self._get_all_part_states():
-                part.octave += 1
-        elif isinstance(node, OctaveDownNode):
-            for part in self._get_all_part_states():
-                part.octave -= 1
-        elif isinstance(node, BarlineNode):
-            pass  # Barlines are purely visual
-        elif isinstance(node, LispListNode):
-            self._process_lisp_list(node)
-        elif isinstance(node, VariableDefinitionNode):
-            self._process_variable_definition(node)
-        elif isinstance(node, VariableReferenceNode):
-            self._process_variable_reference(node)
-        elif isinstance(node, MarkerNode):
-            self._process_marker(node)
-        elif isinstance(node, AtMarkerNode):
-            self._process_at_marker(node)
-        elif isinstance(node, VoiceGroupNode):
-            self._process_voice_group(node)
-        elif isinstance(node, CramNode):
-            self._process_cram(node)
-        elif isinstance(node, RepeatNode):
-            self._process_repeat(node)
-        elif isinstance(node, OnRepetitionsNode):
-            self._process_on_repetitions(node)
-        elif isinstance(node, BracketedSequenceNode):
-            self._process_event_sequence(node.events)
+        node_type = type(node)
+        method_name = _NODE_PROCESSORS.get(node_type)
+        if method_name is None:
+            # Subclasses of the node types are processed like their base class
+            method_name = next(
+                (
+                    _NODE_PROCESSORS[cls]
+                    for cls in node_type.__mro__
+                    if cls in _NODE_PROCESSORS
+                ),
+                None,
+            )
+        if method_name is not None:
+            # Looked up on self so subclasses can override individual handlers
+            getattr(self, method_name)(node)
+
+    def _process_octave_set(self, node: OctaveSetNode) -> None:
+        """Process an octave set (o4)."""
+        for part in self._get_all_part_states():
+            part.octave = node.octave
+
+    def _process_octave_up(self, node: OctaveUpNode) -> None:
+        """Process an octave up (>)."""
+        for part in self._get_all_part_states():
+            part.octave += 1
+
+    def _process_octave_down(self, node: OctaveDownNode) -> None:
+        """Process an octave down (<)."""
+        for part in self._get_all_part_states():
+            part.octave -= 1
+
+    def _process_barline(self, node: BarlineNode) -> None:
+        """Process a barline."""
+        pass  # Barlines are purely visual
+
+    def _process_bracketed_sequence(self, node: BracketedSequenceNode) -> None:
+        """Process a bracketed sequence ([c d e])."""
+        self._process_event_sequence(node.events)
 
     def _process_part(self, node: PartNode) -> None:
         """Process a part declaration and its events."""
@@ -896,6 +893,30 @@ class MidiGenerator:
         return count
 
 
+# MidiGenerator method name for each node type, keyed on the exact class
+_NODE_PROCESSORS: dict[type, str] = {
+    PartNode: "_process_part",
+    EventSequenceNode: "_process_event_sequence",
+    NoteNode: "_process_note",
+    RestNode: "_process_rest",
+    ChordNode: "_process_chord",
+    OctaveSetNode: "_process_octave_set",
+    OctaveUpNode: "_process_octave_up",
+    OctaveDownNode: "_process_octave_down",
+    BarlineNode: "_process_barline",
+    LispListNode: "_process_lisp_list",
+    VariableDefinitionNode: "_process_variable_definition",
+    VariableReferenceNode: "_process_variable_reference",
+    MarkerNode: "_process_marker",
+    AtMarkerNode: "_process_at_marker",
+    VoiceGroupNode: "_process_voice_group",
+    CramNode: "_process_cram",
+    RepeatNode: "_process_repeat",
+    OnRepetitionsNode: "_process_on_repetitions",
+    BracketedSequenceNode: "_process_bracketed_sequence",
+}
+
+
 def generate_midi(ast: RootNode) -> MidiSequence:
     """Convenience function to generate MIDI from an AST.
 
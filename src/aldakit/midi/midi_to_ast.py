@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 
 from ..ast_nodes import (
@@ -69,6 +70,25 @@ DOTTED_DURATION_VALUES: list[tuple[int, int, float]] = [
 ]
 
 
+def _build_duration_catalog() -> list[tuple[float, int, int, int]]:
+    """Merge the duration tables into (length, rank, value, dots), by length.
+
+    rank is the position in the undotted-then-dotted scan order, which
+    decides ties. A dotted value whose length matches an undotted one can
+    never win, so it is dropped.
+    """
+    entries: dict[float, tuple[int, int, int]] = {}
+    scan = [(value, 0, length) for value, length in DURATION_VALUES]
+    scan += DOTTED_DURATION_VALUES
+    for rank, (value, dots, length) in enumerate(scan):
+        entries.setdefault(length, (rank, value, dots))
+    return sorted((length, *entry) for length, entry in entries.items())
+
+
+_DURATION_CATALOG = _build_duration_catalog()
+_CATALOG_BEATS = [entry[0] for entry in _DURATION_CATALOG]
+
+
 # Reverse mapping from GM program to instrument name
 PROGRAM_TO_INSTRUMENT: dict[int, str] = {}
 for name, program in INSTRUMENT_PROGRAMS.items():
@@ -150,36 +170,19 @@ def beats_to_duration(beats: float) -> tuple[int, int]:
     if beats <= 0:
         return 4, 0  # Default to quarter note
 
-    # Try exact matches first
-    for duration_value, length in DURATION_VALUES:
-        if abs(beats - length) < 0.01:
-            return duration_value, 0
-
-    # Try dotted values
-    for duration_value, dots, length in DOTTED_DURATION_VALUES:
-        if abs(beats - length) < 0.01:
-            return duration_value, dots
-
-    # Find closest match
-    best_duration = 4
-    best_dots = 0
-    best_diff = float("inf")
-
-    for duration_value, length in DURATION_VALUES:
-        diff = abs(beats - length)
-        if diff < best_diff:
-            best_diff = diff
-            best_duration = duration_value
-            best_dots = 0
-
-    for duration_value, dots, length in DOTTED_DURATION_VALUES:
-        diff = abs(beats - length)
-        if diff < best_diff:
-            best_diff = diff
-            best_duration = duration_value
-            best_dots = dots
-
-    return best_duration, best_dots
+    # Only the catalog entries either side of beats can be closest
+    index = bisect_left(_CATALOG_BEATS, beats)
+    neighbours = _DURATION_CATALOG[max(index - 1, 0) : index + 1]
+
+    # Near-exact matches win in table order, otherwise take the closest
+    exact = [entry for entry in neighbours if abs(beats - entry[0]) < 0.01]
+    if exact:
+        _, _, duration_value, dots = min(exact, key=lambda entry: entry[1])
+    else:
+        _, _, duration_value, dots = min(
+            neighbours, key=lambda entry: (abs(beats - entry[0]), entry[1])
+        )
+    return duration_value, dots
 
 
 def duration_value_to_beats(denominator: int, dots: int = 0) -> float:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING, Callable, Literal
 
 from .._libremidi import (  # type: ignore[import-not-found]
@@ -41,8 +43,76 @@ MIN_REST_GAP_SECONDS = 0.05
 SWING_DETECTION_MIN_BEATS = 0.15
 SWING_DETECTION_MAX_BEATS = 0.85
 
+# Fixed quantization grids (beats) for tuplet feels; other feels use
+# the session's quantize_grid.
+_FEEL_GRIDS = {"triplet": 1.0 / 3.0, "quintuplet": 0.2}
 
-@dataclass
+
+@lru_cache(maxsize=512)
+def _segment_beats_on_grid(
+    beats: float, grid: float
+) -> tuple[tuple[int, int, float], ...]:
+    """Split a beat length into (denominator, dots, beats) duration segments.
+
+    Lengths reaching here are already snapped to the grid, so a session
+    only ever sees a handful of distinct values and the result is cached.
+    """
+    segments: list[tuple[int, int, float]] = []
+    remaining = beats
+    tolerance = max(grid / 16.0 if grid else 0.005, 0.005)
+
+    while remaining > tolerance:
+        denom, dots = beats_to_duration(remaining)
+        length = duration_value_to_beats(denom, dots)
+        if length <= 0:
+            break
+        segments.append((denom, dots, length))
+        remaining = max(0.0, remaining - length)
+
+    return tuple(segments)
+
+
+def _spell_pitch(pitch: int) -> tuple[str, int, str | None]:
+    """Return (letter, octave, accidental) for a MIDI pitch."""
+    letter, octave, accidentals = midi_pitch_to_note(pitch)
+    return letter, octave, accidentals[0] if accidentals else None
+
+
+# (letter, octave, accidental) for every MIDI pitch, indexed by pitch
+_PITCH_SPELLINGS = tuple(_spell_pitch(pitch) for pitch in range(128))
+
+
+@lru_cache(maxsize=4096)
+def _note(
+    letter: str,
+    octave: int,
+    accidental: str | None,
+    duration: int | None,
+    dots: int,
+    slurred: bool,
+) -> Note:
+    """Return a shared transcribed note.
+
+    Note is frozen and transcriptions draw from a small space of pitches
+    and durations, so identical notes can share one instance.
+    """
+    return Note(
+        pitch=letter,
+        duration=duration,
+        dots=dots,
+        octave=octave,
+        accidental=accidental,
+        slurred=slurred,
+    )
+
+
+@lru_cache(maxsize=64)
+def _rest(duration: int, dots: int) -> Rest:
+    """Return a shared transcribed rest (see _note)."""
+    return Rest(duration=duration, dots=dots)
+
+
+@dataclass(slots=True)
 class PendingNote:
     """A note that has been started but not yet released."""
 
@@ -51,7 +121,7 @@ class PendingNote:
     start_time: float  # In seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordedNote:
     """A completed note with start time and duration."""
 
@@ -184,27 +254,18 @@ class TranscribeSession:
 
     def _process_message(self, msg: MidiMessage, current_time: float) -> None:
         """Process a single MIDI message."""
-        if len(msg.bytes) < 2:
+        # Fetch the payload once; the binding builds a new object per access
+        data = msg.bytes
+        if len(data) < 3:
+            # Note On/Off are the only messages handled, both 3 bytes long
             return
 
-        status = msg.bytes[0]
-        msg_type = status & 0xF0
-
-        if msg_type == 0x90 and len(msg.bytes) >= 3:
-            # Note On
-            pitch = msg.bytes[1]
-            velocity = msg.bytes[2]
-
-            if velocity == 0:
-                # Note On with velocity 0 = Note Off
-                self._note_off(pitch, current_time)
-            else:
-                self._note_on(pitch, velocity, current_time)
-
-        elif msg_type == 0x80 and len(msg.bytes) >= 3:
-            # Note Off
-            pitch = msg.bytes[1]
-            self._note_off(pitch, current_time)
+        status = data[0] & 0xF0
+        if status == 0x90 and data[2]:
+            self._note_on(data[1], data[2], current_time)
+        elif status == 0x90 or status == 0x80:
+            # Note Off, or Note On with velocity 0
+            self._note_off(data[1], current_time)
 
     def _note_on(self, pitch: int, velocity: int, time: float) -> None:
         """Handle a note on event."""
@@ -221,10 +282,10 @@ class TranscribeSession:
 
     def _note_off(self, pitch: int, time: float) -> None:
         """Handle a note off event."""
-        if pitch not in self._pending_notes:
+        pending = self._pending_notes.pop(pitch, None)
+        if pending is None:
             return
 
-        pending = self._pending_notes.pop(pitch)
         duration = time - pending.start_time
 
         self._recorded_notes.append(
@@ -244,27 +305,37 @@ class TranscribeSession:
         if not self._recorded_notes:
             return Seq()
 
-        sorted_notes = sorted(self._recorded_notes, key=lambda n: n.start_time)
+        sorted_notes = sorted(self._recorded_notes, key=attrgetter("start_time"))
         groups = self._group_notes(sorted_notes)
         elements: list = []
         current_time = 0.0
 
+        # Bound once for the loop; the conversions inline _seconds_to_beats
+        # and _beats_to_seconds with the same arithmetic
+        tempo = self.default_tempo
+        segments_for_beats = self._segments_for_beats
+        append_rest_segments = self._append_rest_segments
+        append_group_segments = self._append_group_segments
+
         for group in groups:
             start_time = group[0].start_time
             gap_seconds = start_time - current_time
             if gap_seconds > MIN_REST_GAP_SECONDS:
-                gap_beats = self._seconds_to_beats(gap_seconds)
-                rest_segments = self._segments_for_beats(gap_beats, kind="rest")
-                gained = self._append_rest_segments(rest_segments, elements)
-                current_time += self._beats_to_seconds(gained)
-
-            duration_seconds = max(n.duration for n in group)
-            duration_beats = self._seconds_to_beats(duration_seconds)
-            note_segments = self._segments_for_beats(duration_beats, kind="note")
+                gap_beats = gap_seconds * tempo / 60.0
+                rest_segments = segments_for_beats(gap_beats, kind="rest")
+                gained = append_rest_segments(rest_segments, elements)
+                current_time += gained * 60.0 / tempo
+
+            if len(group) == 1:
+                duration_seconds = group[0].duration
+            else:
+                duration_seconds = max(n.duration for n in group)
+            duration_beats = duration_seconds * tempo / 60.0
+            note_segments = segments_for_beats(duration_beats, kind="note")
             if not note_segments:
                 continue
 
-            gained = self._append_group_segments(group, note_segments, elements)
+            append_group_segments(group, note_segments, elements)
             current_time = start_time + duration_seconds
 
         metadata: dict[str, object] = {
@@ -283,26 +354,22 @@ class TranscribeSession:
 
     def _group_notes(self, notes: list[RecordedNote]) -> list[list[RecordedNote]]:
         groups: list[list[RecordedNote]] = []
-        current_group: list[RecordedNote] = []
-        current_start: float | None = None
-
-        for note in notes:
-            if (
-                current_group
-                and current_start is not None
-                and abs(note.start_time - current_start)
-                > CHORD_GROUPING_TOLERANCE_SECONDS
-            ):
+        if not notes:
+            return groups
+
+        current_group = [notes[0]]
+        current_start = notes[0].start_time
+        groups.append(current_group)
+
+        for note in notes[1:]:
+            start = note.start_time
+            if abs(start - current_start) > CHORD_GROUPING_TOLERANCE_SECONDS:
+                # Open a new group; the appended list keeps filling in place
+                current_group = [note]
+                current_start = start
                 groups.append(current_group)
-                current_group = []
-                current_start = None
-
-            if not current_group:
-                current_start = note.start_time
-            current_group.append(note)
-
-        if current_group:
-            groups.append(current_group)
+            else:
+                current_group.append(note)
 
         return groups
 
@@ -313,15 +380,12 @@ class TranscribeSession:
         return beats * 60.0 / self.default_tempo
 
     def _grid_value(self) -> float:
-        if self.feel == "triplet":
-            return 1.0 / 3.0
-        if self.feel == "quintuplet":
-            return 0.2
-        return self.quantize_grid
+        return _FEEL_GRIDS.get(self.feel, self.quantize_grid)
 
-    def _quantize_beats(self, beats: float, *, kind: str) -> float:
+    def _quantize_beats(
+        self, beats: float, *, kind: str, grid: float | None = None
+    ) -> float:
         beats = max(beats, 0.0)
-        grid = self._grid_value()
 
         if kind == "note" and self.feel == "swing":
             if SWING_DETECTION_MIN_BEATS < beats < SWING_DETECTION_MAX_BEATS:
@@ -332,6 +396,8 @@ class TranscribeSession:
                 return target
             self._swing_next_is_long = True
 
+        if grid is None:
+            grid = self._grid_value()
         if grid > 0:
             return round(beats / grid) * grid
         return beats
@@ -339,31 +405,16 @@ class TranscribeSession:
     def _segments_for_beats(
         self, beats: float, *, kind: str
     ) -> list[tuple[int, int, float]]:
-        quantized = self._quantize_beats(beats, kind=kind)
-        return self._segment_beats(max(quantized, 0.0))
-
-    def _segment_beats(self, beats: float) -> list[tuple[int, int, float]]:
-        segments: list[tuple[int, int, float]] = []
-        remaining = beats
         grid = self._grid_value()
-        tolerance = max(grid / 16.0 if grid else 0.005, 0.005)
-
-        while remaining > tolerance:
-            denom, dots = beats_to_duration(remaining)
-            length = duration_value_to_beats(denom, dots)
-            if length <= 0:
-                break
-            segments.append((denom, dots, length))
-            remaining = max(0.0, remaining - length)
-
-        return segments
+        quantized = self._quantize_beats(beats, kind=kind, grid=grid)
+        return list(_segment_beats_on_grid(max(quantized, 0.0), grid))
 
     def _append_rest_segments(
         self, segments: list[tuple[int, int, float]], elements: list
     ) -> float:
         total = 0.0
         for denom, dots, length in segments:
-            elements.append(Rest(duration=denom, dots=dots))
+            elements.append(_rest(denom, dots))
             total += length
         return total
 
@@ -376,45 +427,26 @@ class TranscribeSession:
         total = 0.0
         is_chord = len(group) > 1
         note_infos = [
-            midi_pitch_to_note(note.pitch) for note in group
-        ]  # (letter, octave, accidentals)
+            _PITCH_SPELLINGS[note.pitch] for note in group
+        ]  # (letter, octave, accidental)
 
         for idx, (denom, dots, length) in enumerate(segments):
             slur = idx < len(segments) - 1
             if is_chord:
-                chord_notes = []
-                for letter, octave, accidentals in note_infos:
-                    accidental = accidentals[0] if accidentals else None
-                    chord_notes.append(
-                        Note(
-                            pitch=letter,
-                            duration=None,
-                            dots=0,
-                            octave=octave,
-                            accidental=accidental,
-                            slurred=slur,
-                        )
-                    )
+                chord_notes = tuple(
+                    _note(letter, octave, accidental, None, 0, slur)
+                    for letter, octave, accidental in note_infos
+                )
                 elements.append(
                     Chord(
-                        notes=tuple(chord_notes),
+                        notes=chord_notes,
                         duration=denom,
                         dots=dots,
                     )
                 )
             else:
-                letter, octave, accidentals = note_infos[0]
-                accidental = accidentals[0] if accidentals else None
-                elements.append(
-                    Note(
-                        pitch=letter,
-                        duration=denom,
-                        dots=dots,
-                        octave=octave,
-                        accidental=accidental,
-                        slurred=slur,
-                    )
-                )
+                letter, octave, accidental = note_infos[0]
+                elements.append(_note(letter, octave, accidental, denom, dots, slur))
             total += length
 
         return total
@@ -431,62 +463,55 @@ class TranscribeSession:
 
         target_beats = 1.0 / division
         tolerance = target_beats / 8.0
+        # Every full group spans the same length, so its duration is fixed
+        group_beats = division * target_beats
+        group_tolerance = tolerance * division
+        base_duration, base_dots = beats_to_duration(group_beats)
+        element_beats = self._element_beats
+        strip_slur = self._strip_slur
 
         new_elements: list = []
         buffer: list = []
         buffer_beats = 0.0
 
-        def flush_buffer() -> None:
-            nonlocal buffer, buffer_beats
-            if buffer:
-                new_elements.extend(buffer)
-            buffer = []
-            buffer_beats = 0.0
-
         for elem in elements:
-            beats = self._element_beats(elem)
+            beats = element_beats(elem)
             if beats is None or abs(beats - target_beats) > tolerance:
-                flush_buffer()
+                if buffer:
+                    new_elements.extend(buffer)
+                    buffer = []
+                    buffer_beats = 0.0
                 new_elements.append(elem)
                 continue
 
-            buffer.append(self._strip_slur(elem))
+            buffer.append(strip_slur(elem))
             buffer_beats += beats
 
             if len(buffer) == division:
-                base_duration, base_dots = beats_to_duration(division * target_beats)
-                if abs(buffer_beats - division * target_beats) <= tolerance * division:
+                if abs(buffer_beats - group_beats) <= group_tolerance:
+                    # The buffer is rebound below, so the Cram can own it
                     new_elements.append(
-                        Cram(
-                            elements=list(buffer),
-                            duration=base_duration,
-                            dots=base_dots,
-                        )
+                        Cram(elements=buffer, duration=base_duration, dots=base_dots)
                     )
                 else:
                     new_elements.extend(buffer)
                 buffer = []
                 buffer_beats = 0.0
 
-        flush_buffer()
+        new_elements.extend(buffer)
         return new_elements
 
     def _element_beats(self, element) -> float | None:
-        if isinstance(element, Note) and element.duration is not None:
+        # Cram also has a duration, but it is never a tuplet member
+        if isinstance(element, (Note, Rest, Chord)) and element.duration is not None:
             return duration_value_to_beats(element.duration, element.dots)
-        if isinstance(element, Rest) and element.duration is not None:
-            return duration_value_to_beats(element.duration, element.dots)
-        if isinstance(element, Chord) and element.duration is not None:
-            return duration_value_to_beats(
-                element.duration, getattr(element, "dots", 0)
-            )
         return None
 
     @staticmethod
     def _strip_slur(element):
         if isinstance(element, Note) and element.slurred:
             return replace(element, slurred=False)
-        if isinstance(element, Chord):
+        if isinstance(element, Chord) and any(note.slurred for note in element.notes):
             stripped_notes = [
                 replace(note, slurred=False) if note.slurred else note
                 for note in element.notes
@@ -329,6 +329,14 @@ class MidiSequence:
             return 0.0
         return max(n.start_time + n.duration for n in self.notes)
 
+    def pitches(self) -> list[int]:
+        """Return the MIDI pitch of every note, in note order."""
+        return [n.pitch for n in self.notes]
+
+    def programs(self) -> frozenset[int]:
+        """Return the set of MIDI programs selected by the sequence."""
+        return frozenset(pc.program for pc in self.program_changes)
+
 
 # Note letter to semitone offset (relative to C)
 NOTE_OFFSETS: dict[str, int] = {
@@ -347,14 +355,11 @@ def note_to_midi(letter: str, octave: int, accidentals: list[str]) -> int:
 
     C4 = MIDI 60 (middle C).
     """
-    base = NOTE_OFFSETS[letter.lower()]
-    midi_note = 12 * (octave + 1) + base
-
-    for acc in accidentals:
-        if acc == "+":  # sharp
-            midi_note += 1
-        elif acc == "-":  # flat
-            midi_note -= 1
-        # "_" (natural) has no effect in this context
+    midi_note = 12 * (octave + 1) + NOTE_OFFSETS[letter.lower()]
+
+    if accidentals:
+        # Sharps raise and flats lower by a semitone each; "_" (natural)
+        # has no effect in this context
+        midi_note += accidentals.count("+") - accidentals.count("-")
 
     return max(0, min(127, midi_note))
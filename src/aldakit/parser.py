@@ -40,6 +40,15 @@ from .errors import AldaSyntaxError
 from .scanner import Scanner
 from .tokens import SourcePosition, Token, TokenType
 
+# Token types that begin a duration component
+_DURATION_TOKENS = frozenset(
+    {
+        TokenType.NOTE_LENGTH,
+        TokenType.NOTE_LENGTH_MS,
+        TokenType.NOTE_LENGTH_SECONDS,
+    }
+)
+
 
 class Parser:
     """Parses Alda tokens into an AST."""
@@ -161,11 +170,14 @@ class Parser:
         events: list[ASTNode] = []
         stop_tokens = stop_tokens or set()
 
-        while not self._is_at_end() and not self._is_part_declaration():
+        while not self._is_at_end():
             # Check for stop tokens
             if self._peek().type in stop_tokens:
                 break
 
+            # A part declaration ends the sequence. Stop tokens are never NAME
+            # or NEWLINE, so checking once after skipping newlines covers both
+            # the current token and the first one past any blank lines.
             self._skip_newlines()
             if self._is_at_end() or self._is_part_declaration():
                 break
@@ -195,65 +207,49 @@ class Parser:
 
     def _parse_primary_event(self) -> ASTNode | None:
         """Parse a primary event (without postfix operators)."""
-        # Barline
-        if self._match(TokenType.BARLINE):
-            return BarlineNode(position=self.tokens[self._current - 1].position)
-
-        # Octave controls
-        if self._match(TokenType.OCTAVE_UP):
-            return OctaveUpNode(position=self.tokens[self._current - 1].position)
-        if self._match(TokenType.OCTAVE_DOWN):
-            return OctaveDownNode(position=self.tokens[self._current - 1].position)
-        if self._match(TokenType.OCTAVE_SET):
-            token = self.tokens[self._current - 1]
-            return OctaveSetNode(octave=token.literal, position=token.position)
+        # Every kind of event starts with its own token type
+        method_name = _PRIMARY_EVENT_PARSERS.get(self._peek().type)
+        if method_name is not None:
+            # Looked up on self so subclasses can override individual parsers
+            return getattr(self, method_name)()
 
-        # S-expression
-        if self._check(TokenType.LEFT_PAREN):
-            return self._parse_sexp()
+        # Unexpected token - skip it
+        if not self._is_at_end():
+            self._advance()
+        return None
 
-        # Markers
-        if self._match(TokenType.MARKER):
-            token = self.tokens[self._current - 1]
-            return MarkerNode(name=token.literal, position=token.position)
+    def _parse_barline(self) -> BarlineNode:
+        """Parse a barline."""
+        return BarlineNode(position=self._advance().position)
 
-        if self._match(TokenType.AT_MARKER):
-            token = self.tokens[self._current - 1]
-            return AtMarkerNode(name=token.literal, position=token.position)
+    def _parse_octave_up(self) -> OctaveUpNode:
+        """Parse an octave up marker (>)."""
+        return OctaveUpNode(position=self._advance().position)
 
-        # Voice marker (starts a voice group)
-        if self._check(TokenType.VOICE_MARKER):
-            return self._parse_voice_group()
+    def _parse_octave_down(self) -> OctaveDownNode:
+        """Parse an octave down marker (<)."""
+        return OctaveDownNode(position=self._advance().position)
 
-        # Cram expression
-        if self._check(TokenType.CRAM_OPEN):
-            return self._parse_cram()
+    def _parse_octave_set(self) -> OctaveSetNode:
+        """Parse an octave set (e.g., 'o4')."""
+        token = self._advance()
+        return OctaveSetNode(octave=token.literal, position=token.position)
 
-        # Bracketed sequence
-        if self._check(TokenType.EVENT_SEQ_OPEN):
-            return self._parse_bracketed_sequence()
+    def _parse_marker(self) -> MarkerNode:
+        """Parse a marker (e.g., '%chorus')."""
+        token = self._advance()
+        return MarkerNode(name=token.literal, position=token.position)
 
-        # Variable definition or reference
+    def _parse_at_marker(self) -> AtMarkerNode:
+        """Parse a jump to a marker (e.g., '@chorus')."""
+        token = self._advance()
+        return AtMarkerNode(name=token.literal, position=token.position)
+
+    def _parse_name(self) -> ASTNode:
+        """Parse a variable definition or reference."""
         if self._is_variable_definition():
             return self._parse_variable_definition()
-
-        if self._check(TokenType.NAME):
-            return self._parse_variable_reference()
-
-        # Rest
-        if self._check(TokenType.REST_LETTER):
-            return self._parse_rest()
-
-        # Note (might become a chord)
-        if self._check(TokenType.NOTE_LETTER):
-            return self._parse_note_or_chord()
-
-        # Unexpected token - skip it
-        if not self._is_at_end():
-            self._advance()
-            return None
-
-        return None
+        return self._parse_variable_reference()
 
     def _parse_postfix(self, event: ASTNode) -> ASTNode:
         """Parse postfix operators (repeat, on-repetitions)."""
@@ -507,36 +503,29 @@ class Parser:
 
     def _is_duration_start(self) -> bool:
         """Check if current token starts a duration."""
-        return (
-            self._check(TokenType.NOTE_LENGTH)
-            or self._check(TokenType.NOTE_LENGTH_MS)
-            or self._check(TokenType.NOTE_LENGTH_SECONDS)
-        )
+        return self.tokens[self._current].type in _DURATION_TOKENS
 
     def _is_duration_start_at(self, pos: int) -> bool:
         """Check if token at position starts a duration."""
         if pos >= len(self.tokens):
             return False
-        token = self.tokens[pos]
-        return token.type in (
-            TokenType.NOTE_LENGTH,
-            TokenType.NOTE_LENGTH_MS,
-            TokenType.NOTE_LENGTH_SECONDS,
-        )
+        return self.tokens[pos].type in _DURATION_TOKENS
 
     def _parse_duration_component(self) -> ASTNode:
         """Parse a single duration component."""
-        if self._match(TokenType.NOTE_LENGTH_MS):
-            token = self.tokens[self._current - 1]
+        token = self._peek()
+        token_type = token.type
+
+        if token_type == TokenType.NOTE_LENGTH_MS:
+            self._current += 1
             return NoteLengthMsNode(ms=token.literal, position=token.position)
 
-        if self._match(TokenType.NOTE_LENGTH_SECONDS):
-            token = self.tokens[self._current - 1]
+        if token_type == TokenType.NOTE_LENGTH_SECONDS:
+            self._current += 1
             return NoteLengthSecondsNode(seconds=token.literal, position=token.position)
 
-        if self._match(TokenType.NOTE_LENGTH):
-            token = self.tokens[self._current - 1]
-            denominator = token.literal
+        if token_type == TokenType.NOTE_LENGTH:
+            self._current += 1
 
             # Count dots
             dots = 0
@@ -544,7 +533,7 @@ class Parser:
                 dots += 1
 
             return NoteLengthNode(
-                denominator=denominator, dots=dots, position=token.position
+                denominator=token.literal, dots=dots, position=token.position
             )
 
         self._error("Expected duration component")
@@ -556,9 +545,13 @@ class Parser:
 
         elements = []
         while not self._check(TokenType.RIGHT_PAREN) and not self._is_at_end():
+            if self._match(TokenType.NEWLINE):
+                # S-expressions may span several lines
+                continue
             element = self._parse_lisp_element()
-            if element:
-                elements.append(element)
+            if element is None:
+                self._error("Unexpected token in S-expression")
+            elements.append(element)
 
         self._consume(TokenType.RIGHT_PAREN, "Expected ')'")
 
@@ -645,6 +638,24 @@ class Parser:
         raise AldaSyntaxError(message, token.position)
 
 
+# Name of the Parser method for each token type that can start a primary event
+_PRIMARY_EVENT_PARSERS: dict[TokenType, str] = {
+    TokenType.BARLINE: "_parse_barline",
+    TokenType.OCTAVE_UP: "_parse_octave_up",
+    TokenType.OCTAVE_DOWN: "_parse_octave_down",
+    TokenType.OCTAVE_SET: "_parse_octave_set",
+    TokenType.LEFT_PAREN: "_parse_sexp",
+    TokenType.MARKER: "_parse_marker",
+    TokenType.AT_MARKER: "_parse_at_marker",
+    TokenType.VOICE_MARKER: "_parse_voice_group",
+    TokenType.CRAM_OPEN: "_parse_cram",
+    TokenType.EVENT_SEQ_OPEN: "_parse_bracketed_sequence",
+    TokenType.NAME: "_parse_name",
+    TokenType.REST_LETTER: "_parse_rest",
+    TokenType.NOTE_LETTER: "_parse_note_or_chord",
+}
+
+
 def parse(source: str, filename: str = "<input>") -> RootNode:
     """Convenience function to parse Alda source code."""
     parser = Parser.from_source(source, filename)
@@ -1,6 +1,8 @@
 """Interactive REPL for aldakit with syntax highlighting and completion."""
 
 import time
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
 
 # Initialize vendored packages path (must be before prompt_toolkit imports)
@@ -46,123 +48,134 @@ ALDA_STYLE = Style.from_dict(
 )
 
 
-class AldaLexer(Lexer):
-    """Syntax highlighter for alda code."""
-
-    def lex_document(self, document: Document):
-        def get_line_tokens(line_number):
-            line = document.lines[line_number]
-            tokens = []
-            i = 0
-            while i < len(line):
-                ch = line[i]
-
-                # Comments
-                if ch == "#":
-                    tokens.append(("class:comment", line[i:]))
-                    break
+@lru_cache(maxsize=1024)
+def _lex_line(line: str) -> tuple[tuple[str, str], ...]:
+    """Split one line into (style class, text) tokens.
 
-                # Instrument/part declaration (word followed by :)
-                # Look ahead to check for colon
-                if ch.isalpha():
-                    j = i
-                    while j < len(line) and (line[j].isalnum() or line[j] == "-"):
-                        j += 1
-                    if j < len(line) and line[j] == ":":
-                        # This is an instrument declaration
-                        tokens.append(("class:instrument", line[i : j + 1]))
-                        i = j + 1
-                        continue
-                    # Not followed by colon - check if it's a note/rest/octave
-                    # (handled below by continuing the loop)
-
-                # S-expressions (tempo, volume, etc.)
-                if ch == "(":
-                    j = i + 1
-                    depth = 1
-                    while j < len(line) and depth > 0:
-                        if line[j] == "(":
-                            depth += 1
-                        elif line[j] == ")":
-                            depth -= 1
-                        j += 1
-                    tokens.append(("class:attribute", line[i:j]))
-                    i = j
-                    continue
-
-                # Notes (with optional accidentals and duration)
-                if ch in "abcdefg":
-                    j = i + 1
-                    # Accidentals
-                    while j < len(line) and line[j] in "+-_":
-                        j += 1
-                    tokens.append(("class:note", line[i:j]))
-                    i = j
-                    # Duration (separate token)
-                    if i < len(line) and (line[i].isdigit() or line[i] == "."):
-                        j = i
-                        while j < len(line) and (line[j].isdigit() or line[j] == "."):
-                            j += 1
-                        # ms or s suffix
-                        if j + 1 < len(line) and line[j : j + 2] == "ms":
-                            j += 2
-                        elif (
-                            j < len(line)
-                            and line[j] == "s"
-                            and (j + 1 >= len(line) or not line[j + 1].isalpha())
-                        ):
-                            j += 1
-                        tokens.append(("class:duration", line[i:j]))
-                        i = j
-                    continue
-
-                # Rest (with optional duration)
-                if ch == "r" and (
-                    i + 1 >= len(line) or line[i + 1] not in "abcdefghijklmnopqstuvwxyz"
+    The REPL re-lexes every line of the buffer on each keystroke, so
+    results are cached by line text.
+    """
+    tokens = []
+    i = 0
+    while i < len(line):
+        ch = line[i]
+
+        # Comments
+        if ch == "#":
+            tokens.append(("class:comment", line[i:]))
+            break
+
+        # Instrument/part declaration (word followed by :)
+        # Look ahead to check for colon
+        if ch.isalpha():
+            j = i
+            while j < len(line) and (line[j].isalnum() or line[j] == "-"):
+                j += 1
+            if j < len(line) and line[j] == ":":
+                # This is an instrument declaration
+                tokens.append(("class:instrument", line[i : j + 1]))
+                i = j + 1
+                continue
+            # Not followed by colon - check if it's a note/rest/octave
+            # (handled below by continuing the loop)
+
+        # S-expressions (tempo, volume, etc.)
+        if ch == "(":
+            j = i + 1
+            depth = 1
+            while j < len(line) and depth > 0:
+                if line[j] == "(":
+                    depth += 1
+                elif line[j] == ")":
+                    depth -= 1
+                j += 1
+            tokens.append(("class:attribute", line[i:j]))
+            i = j
+            continue
+
+        # Notes (with optional accidentals and duration)
+        if ch in "abcdefg":
+            j = i + 1
+            # Accidentals
+            while j < len(line) and line[j] in "+-_":
+                j += 1
+            tokens.append(("class:note", line[i:j]))
+            i = j
+            # Duration (separate token)
+            if i < len(line) and (line[i].isdigit() or line[i] == "."):
+                j = i
+                while j < len(line) and (line[j].isdigit() or line[j] == "."):
+                    j += 1
+                # ms or s suffix
+                if j + 1 < len(line) and line[j : j + 2] == "ms":
+                    j += 2
+                elif (
+                    j < len(line)
+                    and line[j] == "s"
+                    and (j + 1 >= len(line) or not line[j + 1].isalpha())
                 ):
-                    tokens.append(("class:rest", ch))
-                    i += 1
-                    # Duration (separate token)
-                    if i < len(line) and (line[i].isdigit() or line[i] == "."):
-                        j = i
-                        while j < len(line) and (line[j].isdigit() or line[j] == "."):
-                            j += 1
-                        tokens.append(("class:duration", line[i:j]))
-                        i = j
-                    continue
-
-                # Octave set (o followed by number)
-                if ch == "o" and i + 1 < len(line) and line[i + 1].isdigit():
-                    j = i + 1
-                    while j < len(line) and line[j].isdigit():
-                        j += 1
-                    tokens.append(("class:octave", line[i:j]))
-                    i = j
-                    continue
+                    j += 1
+                tokens.append(("class:duration", line[i:j]))
+                i = j
+            continue
+
+        # Rest (with optional duration)
+        if ch == "r" and (
+            i + 1 >= len(line) or line[i + 1] not in "abcdefghijklmnopqstuvwxyz"
+        ):
+            tokens.append(("class:rest", ch))
+            i += 1
+            # Duration (separate token)
+            if i < len(line) and (line[i].isdigit() or line[i] == "."):
+                j = i
+                while j < len(line) and (line[j].isdigit() or line[j] == "."):
+                    j += 1
+                tokens.append(("class:duration", line[i:j]))
+                i = j
+            continue
+
+        # Octave set (o followed by number)
+        if ch == "o" and i + 1 < len(line) and line[i + 1].isdigit():
+            j = i + 1
+            while j < len(line) and line[j].isdigit():
+                j += 1
+            tokens.append(("class:octave", line[i:j]))
+            i = j
+            continue
+
+        # Octave up/down
+        if ch in "<>":
+            tokens.append(("class:octave", ch))
+            i += 1
+            continue
+
+        # Barline
+        if ch == "|":
+            tokens.append(("class:barline", ch))
+            i += 1
+            continue
+
+        # Chord markers
+        if ch == "/":
+            tokens.append(("class:note", ch))
+            i += 1
+            continue
+
+        # Default (whitespace, etc.)
+        tokens.append(("", ch))
+        i += 1
+
+    return tuple(tokens)
 
-                # Octave up/down
-                if ch in "<>":
-                    tokens.append(("class:octave", ch))
-                    i += 1
-                    continue
-
-                # Barline
-                if ch == "|":
-                    tokens.append(("class:barline", ch))
-                    i += 1
-                    continue
 
-                # Chord markers
-                if ch == "/":
-                    tokens.append(("class:note", ch))
-                    i += 1
-                    continue
+class AldaLexer(Lexer):
+    """Syntax highlighter for alda code."""
 
-                # Default (whitespace, etc.)
-                tokens.append(("", ch))
-                i += 1
+    def lex_document(self, document: Document):
+        lines = document.lines
 
-            return tokens
+        def get_line_tokens(line_number):
+            return list(_lex_line(lines[line_number]))
 
         return get_line_tokens
 
@@ -191,9 +204,13 @@ class AldaCompleter(Completer):
         # - At start of line (no content yet), OR
         # - Word is at least 3 chars (to avoid matching notes)
         if ":" not in line and len(word) >= REPL_COMPLETION_MIN_WORD_LENGTH:
-            for inst in self.instruments:
-                if inst.startswith(word):
-                    yield Completion(inst + ": ", start_position=-len(word))
+            # Matches form a contiguous run in the sorted list
+            instruments = self.instruments
+            for index in range(bisect_left(instruments, word), len(instruments)):
+                inst = instruments[index]
+                if not inst.startswith(word):
+                    break
+                yield Completion(inst + ": ", start_position=-len(word))
 
         # Complete attributes after (
         if "(" in line and ")" not in line[line.rfind("(") :]:
@@ -1,8 +1,14 @@
 """Lexer for the Alda music programming language."""
 
+import re
+
 from .errors import AldaScanError
 from .tokens import SourcePosition, Token, TokenType
 
+# Rest of an identifier: the same characters as Scanner._is_identifier_char
+# (``\w`` is str.isalnum() plus "_").
+_IDENTIFIER_TAIL = re.compile(r"[\w-]*")
+
 
 class Scanner:
     """Tokenizes Alda source code."""
@@ -10,6 +16,25 @@ class Scanner:
     NOTE_LETTERS = frozenset("abcdefg")
     WHITESPACE = frozenset(" \t\r")
 
+    # Characters that always form a token on their own in normal mode
+    SINGLE_CHAR_TOKENS = {
+        ">": TokenType.OCTAVE_UP,
+        "<": TokenType.OCTAVE_DOWN,
+        "+": TokenType.SHARP,
+        "-": TokenType.FLAT,
+        "_": TokenType.NATURAL,
+        "~": TokenType.TIE,
+        "|": TokenType.BARLINE,
+        "/": TokenType.SEPARATOR,
+        ":": TokenType.COLON,
+        ".": TokenType.DOT,
+        "=": TokenType.EQUALS,
+        "{": TokenType.CRAM_OPEN,
+        "}": TokenType.CRAM_CLOSE,
+        "[": TokenType.EVENT_SEQ_OPEN,
+        "]": TokenType.EVENT_SEQ_CLOSE,
+    }
+
     def __init__(self, source: str, filename: str = "<input>"):
         self.source = source
         self.filename = filename
@@ -35,7 +60,8 @@ class Scanner:
         self._line_start = 0
         self._sexp_depth = 0
 
-        while not self._is_at_end():
+        source_length = len(self.source)
+        while self._current < source_length:
             self._start = self._current
             self._scan_token()
 
@@ -79,41 +105,20 @@ class Scanner:
     def _scan_normal_token(self, c: str) -> None:
         """Scan a token in normal (non-lisp) mode."""
         # Single character tokens
-        if c == ">":
-            self._add_token(TokenType.OCTAVE_UP)
-        elif c == "<":
-            self._add_token(TokenType.OCTAVE_DOWN)
-        elif c == "+":
-            self._add_token(TokenType.SHARP)
-        elif c == "-":
-            self._add_token(TokenType.FLAT)
-        elif c == "_":
-            self._add_token(TokenType.NATURAL)
-        elif c == "~":
-            self._add_token(TokenType.TIE)
-        elif c == "|":
-            self._add_token(TokenType.BARLINE)
-        elif c == "/":
-            self._add_token(TokenType.SEPARATOR)
-        elif c == ":":
-            self._add_token(TokenType.COLON)
-        elif c == ".":
-            self._add_token(TokenType.DOT)
-        elif c == "=":
-            self._add_token(TokenType.EQUALS)
+        token_type = self.SINGLE_CHAR_TOKENS.get(c)
+        if token_type is not None:
+            self._add_token(token_type)
+        elif c in self.NOTE_LETTERS and not self._is_name_continuation(self._peek()):
+            # Single note letter (not followed by identifier chars that would make it a name)
+            self._add_token(TokenType.NOTE_LETTER, c)
+        elif c in self.NOTE_LETTERS:
+            # Note letter followed by more identifier chars - treat as name (e.g., 'cello')
+            self._scan_name()
         elif c == "(":
             self._sexp_depth += 1
             self._add_token(TokenType.LEFT_PAREN)
         elif c == ")":
             self._error("Unexpected ')' outside of S-expression")
-        elif c == "{":
-            self._add_token(TokenType.CRAM_OPEN)
-        elif c == "}":
-            self._add_token(TokenType.CRAM_CLOSE)
-        elif c == "[":
-            self._add_token(TokenType.EVENT_SEQ_OPEN)
-        elif c == "]":
-            self._add_token(TokenType.EVENT_SEQ_CLOSE)
         elif c == "*":
             self._scan_repeat()
         elif c == "%":
@@ -128,12 +133,6 @@ class Scanner:
             # Rest letter (only if not followed by name continuation chars)
             # Note: r followed by a digit is rest + duration, not a name
             self._add_token(TokenType.REST_LETTER)
-        elif c in self.NOTE_LETTERS and not self._is_name_continuation(self._peek()):
-            # Single note letter (not followed by identifier chars that would make it a name)
-            self._add_token(TokenType.NOTE_LETTER, c)
-        elif c in self.NOTE_LETTERS:
-            # Note letter followed by more identifier chars - treat as name (e.g., 'cello')
-            self._scan_name()
         elif c == "V" and self._peek().isdigit():
             # Voice marker: V followed by digits and colon
             self._scan_voice_marker()
@@ -271,8 +270,7 @@ class Scanner:
 
     def _scan_name(self) -> None:
         """Scan an identifier/name."""
-        while self._is_identifier_char(self._peek()):
-            self._advance()
+        self._current = _IDENTIFIER_TAIL.match(self.source, self._current).end()
         lexeme = self.source[self._start : self._current]
         self._add_token(TokenType.NAME, lexeme)
 
@@ -348,7 +346,7 @@ class Scanner:
         return c
 
     def _peek(self) -> str:
-        if self._is_at_end():
+        if self._current >= len(self.source):
             return "\0"
         return self.source[self._current]
 
@@ -73,7 +73,7 @@ class TokenType(Enum):
     NEWLINE = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourcePosition:
     """Position in source code for error reporting."""
 
@@ -85,7 +85,7 @@ class SourcePosition:
         return f"{self.filename}:{self.line}:{self.column}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """A token produced by the scanner."""
 
@@ -0,0 +1,23 @@
+"""Shared pytest fixtures."""
+
+from functools import lru_cache
+
+import pytest
+
+from aldakit import generate_midi, parse
+
+
+@pytest.fixture(scope="session")
+def midi_cache():
+    """Parse and MIDI-generate each distinct source string once per session.
+
+    Returns a function mapping Alda source to ``(ast, sequence)``. Results
+    are shared between tests, so callers must not mutate them.
+    """
+
+    @lru_cache(maxsize=None)
+    def compile_source(source):
+        ast = parse(source)
+        return ast, generate_midi(ast)
+
+    return compile_source
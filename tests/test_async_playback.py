@@ -165,6 +165,23 @@ class TestAsyncPlaybackManager:
         assert manager.is_playing() is False
         assert elapsed >= 0.1  # At least note duration
 
+    def test_wait_wakes_when_playback_ends(self, manager):
+        """Wait returns when the last slot finishes, not on a poll tick."""
+        seq = MidiSequence(
+            notes=[
+                MidiNote(
+                    pitch=60, velocity=100, start_time=0.0, duration=0.05, channel=0
+                )
+            ]
+        )
+        start = time.perf_counter()
+        manager.play(seq)
+        manager.wait(poll_interval=5.0)
+        elapsed = time.perf_counter() - start
+
+        assert manager.is_playing() is False
+        assert elapsed < 1.0
+
     def test_concurrent_playback_multiple_slots(self, manager):
         """Multiple sequences can play concurrently."""
         seq1 = MidiSequence(
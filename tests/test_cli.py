@@ -23,6 +23,22 @@ from aldakit.cli import (
 )
 
 
+def scripted_input(*lines):
+    """Return an ``input()`` replacement that yields *lines* then raises EOFError.
+
+    Exception classes or instances among *lines* are raised instead of returned.
+    """
+    it = iter(lines)
+
+    def _input(prompt=None):
+        line = next(it, EOFError)
+        if isinstance(line, str):
+            return line
+        raise line
+
+    return _input
+
+
 def test_cli_version_matches_package(capsys):
     parser = create_parser()
     with pytest.raises(SystemExit):
@@ -450,7 +466,6 @@ class TestStdinMode:
 
     def test_handles_keyboard_interrupt(self, monkeypatch, capsys):
         """Handle Ctrl+C gracefully."""
-        call_count = 0
 
         class DummyBackend:
             def __init__(self, port_name=None, virtual_port_name=None):
@@ -468,21 +483,14 @@ class TestStdinMode:
             def is_playing(self):
                 return False
 
-        def fake_input(prompt=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise KeyboardInterrupt
-
         monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        monkeypatch.setattr(builtins, "input", scripted_input(KeyboardInterrupt))
 
         result = stdin_mode(port_name=None, verbose=False)
         assert result == 0
 
     def test_plays_valid_input(self, monkeypatch, capsys):
         """Parse and play valid Alda input."""
-        input_calls = 0
 
         class DummyBackend:
             def __init__(self, port_name=None, virtual_port_name=None):
@@ -501,26 +509,15 @@ class TestStdinMode:
             def is_playing(self):
                 return False
 
-        def fake_input(prompt=None):
-            nonlocal input_calls
-            input_calls += 1
-            if input_calls == 1:
-                return "piano: c d e"
-            elif input_calls == 2:
-                return ""  # First blank line
-            elif input_calls == 3:
-                return ""  # Second blank line triggers play
-            raise EOFError
-
         monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        # Two blank lines trigger play
+        monkeypatch.setattr(builtins, "input", scripted_input("piano: c d e", "", ""))
 
         result = stdin_mode(port_name=None, verbose=False)
         assert result == 0
 
     def test_handles_parse_error(self, monkeypatch, capsys):
         """Show parse error for invalid input."""
-        input_calls = 0
 
         class DummyBackend:
             def __init__(self, port_name=None, virtual_port_name=None):
@@ -538,19 +535,10 @@ class TestStdinMode:
             def is_playing(self):
                 return False
 
-        def fake_input(prompt=None):
-            nonlocal input_calls
-            input_calls += 1
-            if input_calls == 1:
-                return "piano: ((((invalid"
-            elif input_calls == 2:
-                return ""
-            elif input_calls == 3:
-                return ""
-            raise EOFError
-
         monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        monkeypatch.setattr(
+            builtins, "input", scripted_input("piano: ((((invalid", "", "")
+        )
 
         result = stdin_mode(port_name=None, verbose=False)
         assert result == 0
@@ -560,7 +548,6 @@ class TestStdinMode:
 
     def test_verbose_mode(self, monkeypatch, capsys):
         """Verbose mode prints note count."""
-        input_calls = 0
 
         class DummyBackend:
             def __init__(self, port_name=None, virtual_port_name=None):
@@ -578,19 +565,8 @@ class TestStdinMode:
             def is_playing(self):
                 return False
 
-        def fake_input(prompt=None):
-            nonlocal input_calls
-            input_calls += 1
-            if input_calls == 1:
-                return "piano: c d e"
-            elif input_calls == 2:
-                return ""
-            elif input_calls == 3:
-                return ""
-            raise EOFError
-
         monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        monkeypatch.setattr(builtins, "input", scripted_input("piano: c d e", "", ""))
 
         result = stdin_mode(port_name=None, verbose=True)
         assert result == 0
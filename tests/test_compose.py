@@ -108,6 +108,13 @@ class TestNote:
         assert note("c", seconds=2).to_alda() == "c2s"
         assert note("c", slurred=True).to_alda() == "c~"
 
+    def test_note_to_alda_after_transform(self):
+        n = note("c", duration=4)
+        assert n.to_alda() == "c4"
+        assert n.sharpen().with_duration(8).slur().to_alda() == "c+8~"
+        assert n.to_alda() == "c4"
+        assert n == note("c", duration=4)
+
     def test_note_midi_pitch(self):
         assert note("c").midi_pitch == 60  # C4
         assert note("c", octave=5).midi_pitch == 72  # C5
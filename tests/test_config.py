@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 
 from aldakit.config import (
     Config,
@@ -13,6 +14,33 @@ from aldakit.config import (
     _load_file,
 )
 
+_HOME = str(Path.home())
+
+_INI_ALL = (
+    b"[aldakit]\n"
+    b"soundfont = ~/Music/sf2/test.sf2\n"
+    b"backend = audio\n"
+    b"port = TestPort\n"
+    b"tempo = 140\n"
+    b"verbose = true\n"
+)
+_INI_TEMPO_ONLY = b"[aldakit]\ntempo = 100\n"
+_INI_TEMPO_PORT = b"[aldakit]\ntempo = 150\nport = MyPort\n"
+_INI_OTHER_SECTION = b"[other]\nfoo = bar\n"
+_INI_VERBOSE = b"[aldakit]\nverbose = %s\n"
+
+
+def _set_home(monkeypatch, path):
+    """Redirect ``Path.home()`` via the environment rather than patching it."""
+    monkeypatch.setenv("HOME", str(path))
+    monkeypatch.setenv("USERPROFILE", str(path))
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """Directory shared by a test class whose tests each write their own file."""
+    return tmp_path_factory.mktemp("config_tests")
+
 
 class TestConfig:
     """Test the Config dataclass."""
@@ -48,19 +76,18 @@ class TestConfig:
 class TestExpandPath:
     """Test path expansion."""
 
-    def test_expands_tilde(self):
-        result = _expand_path("~/Music/sf2/test.sf2")
-        assert result.startswith(str(Path.home()))
-        assert result.endswith("Music/sf2/test.sf2")
-
-    def test_expands_env_var(self):
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("~/Music/sf2/test.sf2", _HOME + "/Music/sf2/test.sf2"),
+            ("$MY_PATH/soundfont.sf2", "/custom/path/soundfont.sf2"),
+            ("/absolute/path/to/file.sf2", "/absolute/path/to/file.sf2"),
+        ],
+        ids=["tilde", "env_var", "absolute"],
+    )
+    def test_expand_path(self, path, expected):
         with patch.dict(os.environ, {"MY_PATH": "/custom/path"}):
-            result = _expand_path("$MY_PATH/soundfont.sf2")
-            assert result == "/custom/path/soundfont.sf2"
-
-    def test_absolute_path_unchanged(self):
-        result = _expand_path("/absolute/path/to/file.sf2")
-        assert result == "/absolute/path/to/file.sf2"
+            assert _expand_path(path) == expected
 
 
 class TestGetConfigPaths:
@@ -86,8 +113,8 @@ class TestGetConfigPaths:
         config_file = aldakit_dir / "config.ini"
         config_file.write_text("[aldakit]\nport = TestPort\n")
 
-        # Mock home directory
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        # Point the home directory at tmp_path
+        _set_home(monkeypatch, tmp_path)
         # Change to a directory without local config
         monkeypatch.chdir(tmp_path)
 
@@ -104,7 +131,7 @@ class TestGetConfigPaths:
         local_config = tmp_path / "aldakit.ini"
         local_config.write_text("[aldakit]\nport = LocalPort\n")
 
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        _set_home(monkeypatch, tmp_path)
         monkeypatch.chdir(tmp_path)
 
         paths = get_config_paths()
@@ -116,16 +143,9 @@ class TestGetConfigPaths:
 class TestLoadFile:
     """Test loading settings from INI file."""
 
-    def test_loads_all_settings(self, tmp_path):
-        config_file = tmp_path / "config.ini"
-        config_file.write_text("""
-[aldakit]
-soundfont = ~/Music/sf2/test.sf2
-backend = audio
-port = TestPort
-tempo = 140
-verbose = true
-""")
+    def test_loads_all_settings(self, class_tmp):
+        config_file = class_tmp / "all.ini"
+        config_file.write_bytes(_INI_ALL)
         config = Config()
         _load_file(config, config_file)
 
@@ -135,12 +155,9 @@ verbose = true
         assert config.tempo == 140
         assert config.verbose is True
 
-    def test_partial_settings(self, tmp_path):
-        config_file = tmp_path / "config.ini"
-        config_file.write_text("""
-[aldakit]
-tempo = 100
-""")
+    def test_partial_settings(self, class_tmp):
+        config_file = class_tmp / "partial.ini"
+        config_file.write_bytes(_INI_TEMPO_ONLY)
         config = Config()
         _load_file(config, config_file)
 
@@ -152,49 +169,41 @@ tempo = 100
         assert config.port is None
         assert config.verbose is False
 
-    def test_tracks_sources(self, tmp_path):
-        config_file = tmp_path / "config.ini"
-        config_file.write_text("""
-[aldakit]
-tempo = 150
-port = MyPort
-""")
+    def test_tracks_sources(self, class_tmp):
+        config_file = class_tmp / "sources.ini"
+        config_file.write_bytes(_INI_TEMPO_PORT)
         config = Config()
         _load_file(config, config_file)
 
         assert config._sources["tempo"] == str(config_file)
         assert config._sources["port"] == str(config_file)
 
-    def test_ignores_missing_section(self, tmp_path):
-        config_file = tmp_path / "config.ini"
-        config_file.write_text("""
-[other]
-foo = bar
-""")
+    def test_ignores_missing_section(self, class_tmp):
+        config_file = class_tmp / "other.ini"
+        config_file.write_bytes(_INI_OTHER_SECTION)
         config = Config()
         _load_file(config, config_file)
 
         # Should remain default
         assert config.tempo == 120
 
-    def test_boolean_values(self, tmp_path):
-        config_file = tmp_path / "config.ini"
-        # Test various boolean representations
-        config_file.write_text("""
-[aldakit]
-verbose = yes
-""")
-        config = Config()
-        _load_file(config, config_file)
-        assert config.verbose is True
-
-        config_file.write_text("""
-[aldakit]
-verbose = no
-""")
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("yes", True),
+            ("no", False),
+            ("true", True),
+            ("false", False),
+            ("1", True),
+            ("0", False),
+        ],
+    )
+    def test_boolean_values(self, class_tmp, value, expected):
+        config_file = class_tmp / f"verbose_{value}.ini"
+        config_file.write_bytes(_INI_VERBOSE % value.encode())
         config = Config()
         _load_file(config, config_file)
-        assert config.verbose is False
+        assert config.verbose is expected
 
 
 class TestLoadConfig:
@@ -202,7 +211,7 @@ class TestLoadConfig:
 
     def test_default_config(self, tmp_path, monkeypatch):
         # Empty environment with no config files
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        _set_home(monkeypatch, tmp_path)
         monkeypatch.chdir(tmp_path)
         monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
 
@@ -224,7 +233,7 @@ class TestLoadConfig:
 soundfont = /config/soundfont.sf2
 """)
 
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        _set_home(monkeypatch, tmp_path)
         monkeypatch.chdir(tmp_path)
 
         # Env var should override
@@ -252,7 +261,7 @@ port = UserPort
 tempo = 200
 """)
 
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        _set_home(monkeypatch, tmp_path)
         monkeypatch.chdir(tmp_path)
         monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
 
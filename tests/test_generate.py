@@ -1,5 +1,7 @@
 """Tests for the compose.generate module - generative functions."""
 
+import random
+
 import pytest
 from aldakit.compose import (
     Note,
@@ -9,10 +11,13 @@ from aldakit.compose import (
     seq,
 )
 from aldakit.compose.generate import (
+    LFSR,
     # Random selection
     random_note,
     random_choice,
     weighted_choice,
+    weighted_choices,
+    weighted_sampler,
     # Random walks
     random_walk,
     drunk_walk,
@@ -34,6 +39,36 @@ from aldakit.compose.generate import (
 )
 
 
+@pytest.fixture(scope="module")
+def cmaj_triad():
+    """Shared C major triad options (notes are immutable)."""
+    return [note("c"), note("e"), note("g")]
+
+
+@pytest.fixture(scope="module")
+def weighted_triad(cmaj_triad):
+    """Shared weighted C major triad options."""
+    return list(zip(cmaj_triad, (0.5, 0.3, 0.2)))
+
+
+@pytest.fixture(scope="module")
+def heavy_options():
+    """Weighted options dominated by a single note."""
+    return [(note("c"), 100), (note("e"), 1)]
+
+
+@pytest.fixture(scope="module")
+def melody():
+    """Shared four-note melody."""
+    return seq(note("c"), note("d"), note("e"), note("f"))
+
+
+@pytest.fixture(scope="module")
+def cd_chain():
+    """Markov chain alternating between c and d."""
+    return markov_chain({"c": {"d": 1.0}, "d": {"c": 1.0}})
+
+
 # =============================================================================
 # Random Selection Tests
 # =============================================================================
@@ -70,11 +105,10 @@ class TestRandomNote:
 
 
 class TestRandomChoice:
-    def test_random_choice_basic(self):
+    def test_random_choice_basic(self, cmaj_triad):
         """Choose from list of notes."""
-        options = [note("c"), note("e"), note("g")]
-        result = random_choice(options, seed=42)
-        assert result in options
+        result = random_choice(cmaj_triad, seed=42)
+        assert result in cmaj_triad
 
     def test_random_choice_reproducible(self):
         """Same seed produces same choice."""
@@ -90,17 +124,15 @@ class TestRandomChoice:
 
 
 class TestWeightedChoice:
-    def test_weighted_choice_basic(self):
+    def test_weighted_choice_basic(self, weighted_triad):
         """Weighted choice returns valid item."""
-        options = [(note("c"), 0.5), (note("e"), 0.3), (note("g"), 0.2)]
-        result = weighted_choice(options, seed=42)
+        result = weighted_choice(weighted_triad, seed=42)
         assert result.pitch in ["c", "e", "g"]
 
-    def test_weighted_choice_heavy_weight(self):
+    def test_weighted_choice_heavy_weight(self, heavy_options):
         """Heavy weight dominates selection (statistical test)."""
-        options = [(note("c"), 100), (note("e"), 1)]
         # Run multiple times - should mostly get "c"
-        results = [weighted_choice(options, seed=i).pitch for i in range(100)]
+        results = [weighted_choice(heavy_options, seed=i).pitch for i in range(100)]
         c_count = results.count("c")
         assert c_count > 90  # Should be heavily biased toward "c"
 
@@ -120,6 +152,68 @@ class TestWeightedChoice:
             weighted_choice([(note("c"), 0), (note("e"), 0)])
 
 
+class TestWeightedChoices:
+    def test_weighted_choices_length(self, weighted_triad):
+        """Returns k items drawn from the options."""
+        result = weighted_choices(weighted_triad, 10, seed=42)
+        assert len(result) == 10
+        assert all(n.pitch in ["c", "e", "g"] for n in result)
+
+    def test_weighted_choices_matches_weighted_choice(self, weighted_triad):
+        """Batch draws match successive weighted_choice calls on one rng."""
+        rng = random.Random(7)
+        expected = [weighted_choice(weighted_triad, rng=rng) for _ in range(20)]
+        assert weighted_choices(weighted_triad, 20, seed=7) == expected
+
+    def test_weighted_choices_heavy_weight(self, heavy_options):
+        """Heavy weight dominates selection (statistical test)."""
+        results = weighted_choices(heavy_options, 100, seed=0)
+        assert sum(n.pitch == "c" for n in results) > 90
+
+    def test_weighted_choices_validation(self):
+        """Validation matches weighted_choice."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            weighted_choices([], 3)
+        with pytest.raises(ValueError, match="cannot be negative"):
+            weighted_choices([(note("c"), -1)], 3)
+        with pytest.raises(ValueError, match="cannot be zero"):
+            weighted_choices([(note("c"), 0)], 3)
+
+
+class TestWeightedSampler:
+    def test_weighted_sampler_basic(self):
+        """Sampler returns valid items."""
+        draw = weighted_sampler([(note("c"), 0.5), (note("e"), 0.3), (note("g"), 0.2)])
+        assert all(draw().pitch in ["c", "e", "g"] for _ in range(20))
+
+    def test_weighted_sampler_heavy_weight(self):
+        """Heavy weight dominates selection (statistical test)."""
+        draw = weighted_sampler([(note("c"), 100), (note("e"), 1)], seed=42)
+        results = [draw().pitch for _ in range(100)]
+        assert results.count("c") > 90
+
+    def test_weighted_sampler_zero_weight_never_drawn(self):
+        """Zero-weight items are never selected."""
+        draw = weighted_sampler([(note("c"), 1), (note("e"), 0), (note("g"), 3)])
+        assert all(draw().pitch != "e" for _ in range(200))
+
+    def test_weighted_sampler_reproducible(self):
+        """Same seed produces same draws."""
+        options = [(note("c"), 2), (note("e"), 1), (note("g"), 1)]
+        d1 = weighted_sampler(options, seed=7)
+        d2 = weighted_sampler(options, seed=7)
+        assert [d1().pitch for _ in range(20)] == [d2().pitch for _ in range(20)]
+
+    def test_weighted_sampler_validation(self):
+        """Same validation as weighted_choice."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            weighted_sampler([])
+        with pytest.raises(ValueError, match="cannot be negative"):
+            weighted_sampler([(note("c"), -1)])
+        with pytest.raises(ValueError, match="cannot be zero"):
+            weighted_sampler([(note("c"), 0)])
+
+
 # =============================================================================
 # Random Walk Tests
 # =============================================================================
@@ -164,8 +258,7 @@ class TestRandomWalk:
         """Same seed produces same walk."""
         r1 = random_walk("c", 10, seed=123)
         r2 = random_walk("c", 10, seed=123)
-        for n1, n2 in zip(r1.elements, r2.elements):
-            assert n1.pitch == n2.pitch
+        assert r1.elements == r2.elements
 
 
 class TestDrunkWalk:
@@ -190,8 +283,7 @@ class TestDrunkWalk:
         """Same seed produces same walk."""
         r1 = drunk_walk("e", 8, seed=99)
         r2 = drunk_walk("e", 8, seed=99)
-        for n1, n2 in zip(r1.elements, r2.elements):
-            assert n1.pitch == n2.pitch
+        assert r1.elements == r2.elements
 
 
 # =============================================================================
@@ -296,21 +388,18 @@ class TestProbabilitySeq:
 
 
 class TestRestProbability:
-    def test_rest_probability_basic(self):
+    def test_rest_probability_basic(self, melody):
         """Basic rest probability."""
-        melody = seq(note("c"), note("d"), note("e"), note("f"))
         result = rest_probability(melody, 0.5, seed=42)
         assert len(result.elements) == 4
 
-    def test_rest_probability_zero(self):
+    def test_rest_probability_zero(self, melody):
         """Probability 0 keeps all notes."""
-        melody = seq(note("c"), note("d"), note("e"))
         result = rest_probability(melody, 0.0, seed=42)
         assert all(isinstance(e, Note) for e in result.elements)
 
-    def test_rest_probability_one(self):
+    def test_rest_probability_one(self, melody):
         """Probability 1 replaces all notes."""
-        melody = seq(note("c"), note("d"), note("e"))
         result = rest_probability(melody, 1.0, seed=42)
         assert all(isinstance(e, Rest) for e in result.elements)
 
@@ -321,6 +410,16 @@ class TestRestProbability:
         # The original rest should still be there
         assert any(isinstance(e, Rest) for e in result.elements)
 
+    def test_rest_probability_keeps_int_and_float_lengths_apart(self):
+        """Equal-valued int and float lengths each render as given."""
+        as_int = rest_probability(seq(note("c", seconds=2)), 1.0)
+        as_float = rest_probability(seq(note("c", seconds=2.0)), 1.0)
+        assert as_int.to_alda() == "r2s"
+        assert as_float.to_alda() == "r2.0s"
+
+        assert euclidean(1, 2, duration=4).elements[1].to_alda() == "r4"
+        assert euclidean(1, 2, duration=4.0).elements[1].to_alda() == "r4.0"
+
 
 # =============================================================================
 # Markov Chain Tests
@@ -341,10 +440,9 @@ class TestMarkovChain:
         assert len(result.elements) == 10
         assert all(isinstance(e, Note) for e in result.elements)
 
-    def test_markov_chain_starts_correct(self):
+    def test_markov_chain_starts_correct(self, cd_chain):
         """Chain starts with specified note."""
-        chain = markov_chain({"c": {"d": 1.0}, "d": {"c": 1.0}})
-        result = chain.generate(start="c", length=5, seed=42)
+        result = cd_chain.generate(start="c", length=5, seed=42)
         assert result.elements[0].pitch == "c"
 
     def test_markov_chain_follows_transitions(self):
@@ -360,10 +458,9 @@ class TestMarkovChain:
         pitches = [n.pitch for n in result.elements]
         assert pitches == ["c", "d", "e", "c", "d", "e"]
 
-    def test_markov_chain_with_duration(self):
+    def test_markov_chain_with_duration(self, cd_chain):
         """Generated notes have specified duration."""
-        chain = markov_chain({"c": {"d": 1.0}, "d": {"c": 1.0}})
-        result = chain.generate(start="c", length=5, duration=8, seed=42)
+        result = cd_chain.generate(start="c", length=5, duration=8, seed=42)
         assert all(n.duration == 8 for n in result.elements)
 
     def test_markov_chain_reproducible(self):
@@ -377,8 +474,7 @@ class TestMarkovChain:
         )
         r1 = chain.generate(start="c", length=10, seed=123)
         r2 = chain.generate(start="c", length=10, seed=123)
-        for n1, n2 in zip(r1.elements, r2.elements):
-            assert n1.pitch == n2.pitch
+        assert r1.elements == r2.elements
 
     def test_markov_chain_empty_raises(self):
         """Empty chain raises error."""
@@ -386,6 +482,12 @@ class TestMarkovChain:
         with pytest.raises(ValueError, match="no transitions"):
             chain.generate(length=5)
 
+    def test_markov_chain_zero_weight_row_raises(self):
+        """A state whose outgoing weights are all zero is rejected."""
+        chain = MarkovChain({"c": {"d": 0, "e": 0}, "d": {"c": 1}, "e": {"c": 1}})
+        with pytest.raises(ValueError, match="from 'c' must be greater than zero"):
+            chain.generate(start="c", length=6, seed=1)
+
 
 class TestLearnMarkov:
     def test_learn_markov_basic(self):
@@ -591,8 +693,7 @@ class TestShiftRegister:
         """Same initial value produces same sequence."""
         r1 = shift_register(16, bits=8, initial=42)
         r2 = shift_register(16, bits=8, initial=42)
-        for n1, n2 in zip(r1.elements, r2.elements):
-            assert n1.pitch == n2.pitch
+        assert r1.elements == r2.elements
 
     def test_shift_register_binary_mode(self):
         """Binary mode produces notes and rests."""
@@ -628,6 +729,45 @@ class TestShiftRegister:
             shift_register(16, taps=[0, 10], bits=4)
 
 
+class TestLFSR:
+    def test_lfsr_matches_shift_register(self):
+        """A fresh LFSR produces the same pattern as shift_register."""
+        scale = ["c", "e", "g", "b"]
+        expected = shift_register(12, bits=4, scale=scale, initial=5)
+        result = LFSR(bits=4, initial=5).generate(12, scale=scale)
+        assert result.to_alda() == expected.to_alda()
+
+    def test_lfsr_continues_between_calls(self):
+        """Successive calls continue the register instead of restarting."""
+        lfsr = LFSR(bits=4)
+        first = lfsr.states(6)
+        second = lfsr.states(6)
+        assert first + second == LFSR(bits=4).states(12)
+
+    def test_lfsr_binary_mode(self):
+        """Binary mode matches shift_register output."""
+        expected = shift_register(16, bits=8, mode="binary")
+        result = LFSR(bits=8).generate(16, mode="binary")
+        assert result.to_alda() == expected.to_alda()
+
+    def test_lfsr_validation(self):
+        """Invalid bits and taps are rejected at construction."""
+        with pytest.raises(ValueError, match="between 1 and 16"):
+            LFSR(bits=17)
+        with pytest.raises(ValueError, match="out of range"):
+            LFSR(bits=4, taps=[0, 4])
+
+    def test_lfsr_length_must_be_positive(self):
+        """Zero and negative lengths are rejected, as in shift_register."""
+        lfsr = LFSR(bits=4)
+        for length in (0, -1):
+            with pytest.raises(ValueError, match="length must be positive"):
+                lfsr.generate(length)
+            with pytest.raises(ValueError, match="length must be positive"):
+                lfsr.states(length)
+        assert lfsr.register == 1
+
+
 class TestTuringMachine:
     def test_turing_machine_basic(self):
         """Basic Turing Machine generation."""
@@ -666,8 +806,7 @@ class TestTuringMachine:
         """Same seed produces same sequence."""
         r1 = turing_machine(16, bits=8, probability=0.3, seed=123)
         r2 = turing_machine(16, bits=8, probability=0.3, seed=123)
-        for n1, n2 in zip(r1.elements, r2.elements):
-            assert n1.pitch == n2.pitch
+        assert r1.elements == r2.elements
 
     def test_turing_machine_with_duration(self):
         """Turing Machine with specified duration."""
@@ -680,6 +819,43 @@ class TestTuringMachine:
             turing_machine(16, probability=1.5)
 
 
+# =============================================================================
+# Shared Generator Tests
+# =============================================================================
+
+
+class TestSharedRng:
+    def test_rng_matches_seed(self):
+        """Passing a seeded generator matches passing the seed."""
+        r1 = random_walk("c", 10, seed=7)
+        r2 = random_walk("c", 10, rng=random.Random(7))
+        assert r1.to_alda() == r2.to_alda()
+
+    def test_rng_takes_precedence_over_seed(self):
+        """An explicit generator is used even when a seed is given."""
+        r1 = turing_machine(16, probability=0.5, seed=1, rng=random.Random(2))
+        r2 = turing_machine(16, probability=0.5, seed=2)
+        assert r1.to_alda() == r2.to_alda()
+
+    def test_rng_shared_across_pipeline(self):
+        """One generator threaded through several calls is reproducible."""
+
+        def pipeline(rng):
+            melody = drunk_walk("c", 8, duration=8, rng=rng)
+            chain = learn_markov(melody)
+            more = chain.generate(length=8, duration=8, rng=rng)
+            return rest_probability(melody + more, 0.3, rng=rng).to_alda()
+
+        assert pipeline(random.Random(5)) == pipeline(random.Random(5))
+
+    def test_rng_state_advances(self):
+        """Successive calls on a shared generator continue its stream."""
+        rng = random.Random(3)
+        first = probability_seq(["c", "d", "e"], 16, rng=rng)
+        second = probability_seq(["c", "d", "e"], 16, rng=rng)
+        assert first.to_alda() != second.to_alda()
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -698,10 +874,9 @@ class TestIntegration:
         alda = result.to_alda()
         assert len(alda) > 0
 
-    def test_markov_to_alda(self):
+    def test_markov_to_alda(self, cd_chain):
         """Markov chain output can be exported to Alda."""
-        chain = markov_chain({"c": {"d": 1.0}, "d": {"c": 1.0}})
-        result = chain.generate(start="c", length=4, duration=8, seed=42)
+        result = cd_chain.generate(start="c", length=4, duration=8, seed=42)
         alda = result.to_alda()
         assert "c8" in alda or "d8" in alda
 
@@ -1,5 +1,7 @@
 """Tests for MIDI generation."""
 
+import pytest
+
 from aldakit import parse, generate_midi
 from aldakit.midi import (
     MidiSequence,
@@ -42,107 +44,100 @@ class TestNoteToMidi:
 class TestMidiGenerator:
     """Test MIDI generation from AST."""
 
-    def test_single_note(self):
-        ast = parse("c")
-        seq = generate_midi(ast)
+    def test_single_note(self, midi_cache):
+        _, seq = midi_cache("c")
         assert len(seq.notes) == 1
         assert seq.notes[0].pitch == 60  # C4
 
-    def test_note_with_octave(self):
-        ast = parse("o5 c")
-        seq = generate_midi(ast)
+    def test_note_with_octave(self, midi_cache):
+        _, seq = midi_cache("o5 c")
         assert seq.notes[0].pitch == 72  # C5
 
-    def test_note_with_accidental(self):
-        ast = parse("c+")
-        seq = generate_midi(ast)
+    def test_note_with_accidental(self, midi_cache):
+        _, seq = midi_cache("c+")
         assert seq.notes[0].pitch == 61  # C#4
 
-    def test_octave_up(self):
-        ast = parse("> c")
-        seq = generate_midi(ast)
+    def test_octave_up(self, midi_cache):
+        _, seq = midi_cache("> c")
         assert seq.notes[0].pitch == 72  # C5
 
-    def test_octave_down(self):
-        ast = parse("< c")
-        seq = generate_midi(ast)
+    def test_octave_down(self, midi_cache):
+        _, seq = midi_cache("< c")
         assert seq.notes[0].pitch == 48  # C3
 
-    def test_multiple_notes(self):
-        ast = parse("c d e")
-        seq = generate_midi(ast)
+    def test_multiple_notes(self, midi_cache):
+        _, seq = midi_cache("c d e")
         assert len(seq.notes) == 3
         assert seq.notes[0].pitch == 60  # C4
         assert seq.notes[1].pitch == 62  # D4
         assert seq.notes[2].pitch == 64  # E4
 
-    def test_rest_advances_time(self):
-        ast = parse("c r d")
-        seq = generate_midi(ast)
+    def test_rest_advances_time(self, midi_cache):
+        _, seq = midi_cache("c r d")
         assert len(seq.notes) == 2
         # D should start later than C's end
         assert seq.notes[1].start_time > seq.notes[0].start_time + seq.notes[0].duration
 
+    def test_node_subclass_processed_like_base(self):
+        from aldakit.ast_nodes import NoteNode, RootNode
 
-class TestDurations:
-    """Test duration calculations."""
+        class TaggedNote(NoteNode):
+            pass
 
-    def test_quarter_note(self):
-        ast = parse("c4")
+        ast = RootNode(children=[TaggedNote(letter="e", accidentals=[], duration=None)])
         seq = generate_midi(ast)
-        # At 120 BPM, quarter note = 0.5 seconds
-        assert (
-            abs(seq.notes[0].duration - 0.5 * 0.9) < 0.01
-        )  # 0.9 is default quantization
+        assert [n.pitch for n in seq.notes] == [64]
 
-    def test_half_note(self):
-        ast = parse("c2")
-        seq = generate_midi(ast)
-        # At 120 BPM, half note = 1.0 seconds
-        assert abs(seq.notes[0].duration - 1.0 * 0.9) < 0.01
+    def test_generator_subclass_override_is_used(self):
+        from aldakit.ast_nodes import NoteNode
+        from aldakit.midi.generator import MidiGenerator
 
-    def test_whole_note(self):
-        ast = parse("c1")
-        seq = generate_midi(ast)
-        # At 120 BPM, whole note = 2.0 seconds
-        assert abs(seq.notes[0].duration - 2.0 * 0.9) < 0.01
+        class RestAsNoteGenerator(MidiGenerator):
+            def _process_rest(self, node):
+                self._process_note(NoteNode(letter="g", accidentals=[], duration=None))
 
-    def test_dotted_note(self):
-        ast = parse("c4.")
-        seq = generate_midi(ast)
-        # Dotted quarter = quarter + eighth = 0.75 seconds at 120 BPM
-        expected = 0.75 * 0.9
-        assert abs(seq.notes[0].duration - expected) < 0.01
+        seq = RestAsNoteGenerator().generate(parse("c r"))
+        assert [n.pitch for n in seq.notes] == [60, 67]
 
-    def test_ms_duration(self):
-        ast = parse("c500ms")
-        seq = generate_midi(ast)
-        assert abs(seq.notes[0].duration - 0.5 * 0.9) < 0.01
 
-    def test_seconds_duration(self):
-        ast = parse("c2s")
-        seq = generate_midi(ast)
-        assert abs(seq.notes[0].duration - 2.0 * 0.9) < 0.01
+class TestDurations:
+    """Test duration calculations."""
+
+    # Sounding length in seconds at the default 120 BPM, before the default
+    # 0.9 quantization is applied
+    @pytest.mark.parametrize(
+        "source, seconds",
+        [
+            ("c4", 0.5),  # quarter note
+            ("c2", 1.0),  # half note
+            ("c1", 2.0),  # whole note
+            ("c4.", 0.75),  # dotted quarter = quarter + eighth
+            ("c500ms", 0.5),
+            ("c2s", 2.0),
+        ],
+        ids=["quarter", "half", "whole", "dotted", "ms", "seconds"],
+    )
+    def test_note_duration(self, midi_cache, source, seconds):
+        _, seq = midi_cache(source)
+        assert abs(seq.notes[0].duration - seconds * 0.9) < 0.01
 
 
 class TestChords:
     """Test chord generation."""
 
-    def test_simple_chord(self):
-        ast = parse("c/e/g")
-        seq = generate_midi(ast)
+    def test_simple_chord(self, midi_cache):
+        _, seq = midi_cache("c/e/g")
         assert len(seq.notes) == 3
         # All notes start at the same time
         assert seq.notes[0].start_time == seq.notes[1].start_time
         assert seq.notes[1].start_time == seq.notes[2].start_time
         # Check pitches (C, E, G)
-        pitches = sorted(n.pitch for n in seq.notes)
+        pitches = sorted(seq.pitches())
         assert pitches == [60, 64, 67]
 
-    def test_chord_with_octave(self):
-        ast = parse("c/>e/g")
-        seq = generate_midi(ast)
-        pitches = sorted(n.pitch for n in seq.notes)
+    def test_chord_with_octave(self, midi_cache):
+        _, seq = midi_cache("c/>e/g")
+        pitches = sorted(seq.pitches())
         # C4, E5, G5
         assert pitches == [60, 76, 79]
 
@@ -150,15 +145,13 @@ class TestChords:
 class TestTempo:
     """Test tempo handling."""
 
-    def test_tempo_attribute(self):
-        ast = parse("(tempo 60) c4")
-        seq = generate_midi(ast)
+    def test_tempo_attribute(self, midi_cache):
+        _, seq = midi_cache("(tempo 60) c4")
         # At 60 BPM, quarter note = 1.0 seconds
         assert abs(seq.notes[0].duration - 1.0 * 0.9) < 0.01
 
-    def test_global_tempo(self):
-        ast = parse("(tempo! 240) c4")
-        seq = generate_midi(ast)
+    def test_global_tempo(self, midi_cache):
+        _, seq = midi_cache("(tempo! 240) c4")
         # At 240 BPM, quarter note = 0.25 seconds
         assert abs(seq.notes[0].duration - 0.25 * 0.9) < 0.01
 
@@ -166,15 +159,13 @@ class TestTempo:
 class TestVolume:
     """Test volume handling."""
 
-    def test_volume_attribute(self):
-        ast = parse("(vol 50) c")
-        seq = generate_midi(ast)
+    def test_volume_attribute(self, midi_cache):
+        _, seq = midi_cache("(vol 50) c")
         # 50% of 127 ~ 63
         assert seq.notes[0].velocity == 63
 
-    def test_dynamic_marking(self):
-        ast = parse("(ff) c")
-        seq = generate_midi(ast)
+    def test_dynamic_marking(self, midi_cache):
+        _, seq = midi_cache("(ff) c")
         # ff = 88 velocity (official Alda spec)
         assert seq.notes[0].velocity == 88
 
@@ -182,26 +173,23 @@ class TestVolume:
 class TestParts:
     """Test part/instrument handling."""
 
-    def test_piano_part(self):
-        ast = parse("piano: c d e")
-        seq = generate_midi(ast)
+    def test_piano_part(self, midi_cache):
+        _, seq = midi_cache("piano: c d e")
         assert len(seq.notes) == 3
         assert len(seq.program_changes) >= 1
         # Piano = program 0
         assert seq.program_changes[0].program == 0
 
-    def test_violin_part(self):
-        ast = parse("violin: c d e")
-        seq = generate_midi(ast)
+    def test_violin_part(self, midi_cache):
+        _, seq = midi_cache("violin: c d e")
         # Violin = program 40
-        assert any(pc.program == 40 for pc in seq.program_changes)
+        assert 40 in seq.programs()
 
-    def test_multiple_parts(self):
-        ast = parse("piano: c d e\nviolin: f g a")
-        seq = generate_midi(ast)
+    def test_multiple_parts(self, midi_cache):
+        _, seq = midi_cache("piano: c d e\nviolin: f g a")
         assert len(seq.notes) == 6
         # Should have program changes for both
-        programs = [pc.program for pc in seq.program_changes]
+        programs = seq.programs()
         assert 0 in programs  # Piano
         assert 40 in programs  # Violin
 
@@ -209,9 +197,8 @@ class TestParts:
 class TestVariables:
     """Test variable handling."""
 
-    def test_variable_definition_and_reference(self):
-        ast = parse("theme = c d e\ntheme theme")
-        seq = generate_midi(ast)
+    def test_variable_definition_and_reference(self, midi_cache):
+        _, seq = midi_cache("theme = c d e\ntheme theme")
         # Definition stores but doesn't emit; 3 + 3 from two references = 6
         assert len(seq.notes) == 6
 
@@ -219,23 +206,20 @@ class TestVariables:
 class TestRepeats:
     """Test repeat handling."""
 
-    def test_repeat_note(self):
-        ast = parse("c*4")
-        seq = generate_midi(ast)
+    def test_repeat_note(self, midi_cache):
+        _, seq = midi_cache("c*4")
         assert len(seq.notes) == 4
 
-    def test_repeat_sequence(self):
-        ast = parse("[c d]*3")
-        seq = generate_midi(ast)
+    def test_repeat_sequence(self, midi_cache):
+        _, seq = midi_cache("[c d]*3")
         assert len(seq.notes) == 6
 
 
 class TestVoices:
     """Test voice handling."""
 
-    def test_two_voices(self):
-        ast = parse("V1: c4 d4 V2: e4 f4 V0:")
-        seq = generate_midi(ast)
+    def test_two_voices(self, midi_cache):
+        _, seq = midi_cache("V1: c4 d4 V2: e4 f4 V0:")
         # Both voices should have 2 notes
         assert len(seq.notes) == 4
         # Notes should overlap in time
@@ -247,9 +231,8 @@ class TestVoices:
 class TestCram:
     """Test cram expression handling."""
 
-    def test_cram(self):
-        ast = parse("{c d e}2")
-        seq = generate_midi(ast)
+    def test_cram(self, midi_cache):
+        _, seq = midi_cache("{c d e}2")
         assert len(seq.notes) == 3
         # Total duration should be a half note at default tempo
         total_duration = (
@@ -262,9 +245,8 @@ class TestCram:
 class TestSequenceProperties:
     """Test MidiSequence properties."""
 
-    def test_duration(self):
-        ast = parse("c4 d4 e4")
-        seq = generate_midi(ast)
+    def test_duration(self, midi_cache):
+        _, seq = midi_cache("c4 d4 e4")
         # 3 quarter notes at 120 BPM = 1.5 seconds
         assert 1.4 < seq.duration() < 1.6
 
@@ -272,6 +254,16 @@ class TestSequenceProperties:
         seq = MidiSequence()
         assert seq.duration() == 0.0
 
+    def test_pitches(self, midi_cache):
+        _, seq = midi_cache("c d e")
+        assert seq.pitches() == [60, 62, 64]
+        assert MidiSequence().pitches() == []
+
+    def test_programs(self, midi_cache):
+        _, seq = midi_cache("piano: c d e\nviolin: f g a")
+        assert seq.programs() == frozenset({0, 40})
+        assert MidiSequence().programs() == frozenset()
+
 
 class TestInstrumentMapping:
     """Test instrument name to MIDI program mapping."""
@@ -1,5 +1,6 @@
 """Tests for MIDI backend base class."""
 
+import threading
 import time
 from pathlib import Path
 
@@ -9,6 +10,11 @@ from aldakit.midi.backends.base import MidiBackend
 from aldakit.midi.types import MidiSequence
 
 
+# The test backends never read or mutate what they are asked to play,
+# so one empty sequence serves every test.
+EMPTY_SEQUENCE = MidiSequence()
+
+
 # =============================================================================
 # Concrete Test Backend
 # =============================================================================
@@ -17,6 +23,8 @@ from aldakit.midi.types import MidiSequence
 class ConcreteBackend(MidiBackend):
     """Concrete implementation of MidiBackend for testing."""
 
+    __slots__ = ("_playing", "_play_count", "_stop_count", "_concurrent")
+
     def __init__(self):
         self._playing = False
         self._play_count = 0
@@ -48,30 +56,50 @@ class ConcreteBackend(MidiBackend):
 
 
 class TimedPlaybackBackend(MidiBackend):
-    """Backend that simulates timed playback for wait() testing."""
+    """Backend that simulates timed playback for wait() testing.
+
+    A timer sets ``_done`` when the simulated playback ends, so
+    is_playing() is a flag check rather than wall-clock arithmetic.
+    """
+
+    __slots__ = ("_play_duration", "_done", "_timer")
 
     def __init__(self, play_duration: float = 0.1):
-        self._playing = False
         self._play_duration = play_duration
-        self._play_start = 0.0
+        self._done = threading.Event()
+        self._done.set()
+        self._timer: threading.Timer | None = None
 
     def play(self, sequence: MidiSequence) -> int | None:
-        self._playing = True
-        self._play_start = time.time()
+        self._done.clear()
+        self._timer = threading.Timer(self._play_duration, self._done.set)
+        self._timer.daemon = True
+        self._timer.start()
         return 1
 
     def save(self, sequence: MidiSequence, path: Path | str) -> None:
         pass
 
     def stop(self) -> None:
-        self._playing = False
+        if self._timer is not None:
+            self._timer.cancel()
+        self._done.set()
 
     def is_playing(self) -> bool:
-        if self._playing:
-            elapsed = time.time() - self._play_start
-            if elapsed >= self._play_duration:
-                self._playing = False
-        return self._playing
+        return not self._done.is_set()
+
+
+class MinimalBackend(MidiBackend):
+    """Backend implementing only the abstract methods, to exercise defaults."""
+
+    def play(self, sequence: MidiSequence) -> int | None:
+        return None
+
+    def save(self, sequence: MidiSequence, path: Path | str) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
 
 
 # =============================================================================
@@ -87,6 +115,10 @@ class TestMidiBackendAbstract:
         with pytest.raises(TypeError):
             MidiBackend()
 
+    def test_slotted_subclass_has_no_dict(self):
+        """Base declares no instance state, so slotted subclasses stay dict-free."""
+        assert not hasattr(ConcreteBackend(), "__dict__")
+
 
 # =============================================================================
 # Default Implementation Tests
@@ -98,49 +130,16 @@ class TestMidiBackendDefaults:
 
     def test_is_playing_default(self):
         """Default is_playing returns False."""
-        # Test via base class method called from a subclass that doesn't override
-        class MinimalBackend(MidiBackend):
-            def play(self, sequence):
-                return None
-
-            def save(self, sequence, path):
-                pass
-
-            def stop(self):
-                pass
-
         backend = MinimalBackend()
         assert backend.is_playing() is False
 
     def test_concurrent_mode_default(self):
         """Default concurrent_mode returns False."""
-
-        class MinimalBackend(MidiBackend):
-            def play(self, sequence):
-                return None
-
-            def save(self, sequence, path):
-                pass
-
-            def stop(self):
-                pass
-
         backend = MinimalBackend()
         assert backend.concurrent_mode is False
 
     def test_concurrent_mode_setter_default(self):
         """Default concurrent_mode setter does nothing."""
-
-        class MinimalBackend(MidiBackend):
-            def play(self, sequence):
-                return None
-
-            def save(self, sequence, path):
-                pass
-
-            def stop(self):
-                pass
-
         backend = MinimalBackend()
         # Setting should not raise, but also not change anything
         backend.concurrent_mode = True
@@ -149,7 +148,7 @@ class TestMidiBackendDefaults:
     def test_wait_blocks_until_done(self):
         """wait() blocks until is_playing() returns False."""
         backend = TimedPlaybackBackend(play_duration=0.05)
-        seq = MidiSequence(notes=[], program_changes=[], control_changes=[], tempo_changes=[])
+        seq = EMPTY_SEQUENCE
 
         backend.play(seq)
         assert backend.is_playing() is True
@@ -184,7 +183,7 @@ class TestConcreteBackend:
     def test_play_increments_count(self):
         """play() increments play count."""
         backend = ConcreteBackend()
-        seq = MidiSequence(notes=[], program_changes=[], control_changes=[], tempo_changes=[])
+        seq = EMPTY_SEQUENCE
 
         backend.play(seq)
         assert backend._play_count == 1
@@ -195,7 +194,7 @@ class TestConcreteBackend:
     def test_play_returns_slot_id(self):
         """play() returns slot ID."""
         backend = ConcreteBackend()
-        seq = MidiSequence(notes=[], program_changes=[], control_changes=[], tempo_changes=[])
+        seq = EMPTY_SEQUENCE
 
         slot_id = backend.play(seq)
         assert slot_id == 1
@@ -210,7 +209,7 @@ class TestConcreteBackend:
     def test_is_playing_reflects_state(self):
         """is_playing() reflects backend state."""
         backend = ConcreteBackend()
-        seq = MidiSequence(notes=[], program_changes=[], control_changes=[], tempo_changes=[])
+        seq = EMPTY_SEQUENCE
 
         assert backend.is_playing() is False
 
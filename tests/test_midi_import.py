@@ -133,6 +133,15 @@ class TestBeatsToDuration:
         assert duration == 20
         assert dots == 0
 
+    def test_closest_match(self):
+        """Lengths off the table snap to the nearest duration."""
+        assert beats_to_duration(0.9) == (4, 0)
+        assert beats_to_duration(10.0) == (1, 1)
+
+    def test_equal_distance_prefers_undotted(self):
+        """5 beats is equally far from whole and dotted whole."""
+        assert beats_to_duration(5.0) == (1, 0)
+
 
 class TestDurationValueToBeats:
     """Tests for duration_value_to_beats helper."""
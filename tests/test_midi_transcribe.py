@@ -317,6 +317,18 @@ class TestMidiInBindings:
         assert isinstance(messages, list)
         assert len(messages) == 0
 
+    def test_midi_in_poll_into_empty(self):
+        """poll_into writes nothing into preallocated buffers when empty."""
+        from array import array
+
+        from aldakit._libremidi import MidiIn
+
+        midi_in = MidiIn()
+        data = bytearray(3 * 16)
+        timestamps = array("q", bytes(8 * 16))
+        assert midi_in.poll_into(data, timestamps) == 0
+        assert data == bytearray(3 * 16)
+
     def test_midi_in_has_messages(self):
         """has_messages returns False when empty."""
         from aldakit._libremidi import MidiIn
@@ -541,6 +553,18 @@ class TestTranscribeSessionElementBeats:
         result = session._element_beats(c)
         assert result is None
 
+    def test_element_beats_dotted(self):
+        """Dots extend the element's beats."""
+        session = TranscribeSession()
+        assert session._element_beats(Note(pitch="c", duration=4, dots=1)) == 1.5
+        assert session._element_beats(Rest(duration=8, dots=1)) == 0.75
+
+    def test_element_beats_other_element(self):
+        """Elements other than notes, rests and chords return None."""
+        session = TranscribeSession()
+        cram = Cram(elements=[Note(pitch="c"), Note(pitch="d")], duration=4)
+        assert session._element_beats(cram) is None
+
 
 class TestTranscribeSessionStripSlur:
     """Tests for _strip_slur method."""
@@ -570,6 +594,11 @@ class TestTranscribeSessionStripSlur:
         result = TranscribeSession._strip_slur(c)
         assert all(not n.slurred for n in result.notes)
 
+    def test_strip_slur_unslurred_chord_returned_as_is(self):
+        """A chord with no slurred notes is returned unchanged."""
+        c = Chord(notes=(Note(pitch="c"), Note(pitch="e")))
+        assert TranscribeSession._strip_slur(c) is c
+
     def test_strip_slur_rest(self):
         """Strip slur from rest returns same."""
         r = Rest(duration=4)
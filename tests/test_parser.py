@@ -276,6 +276,19 @@ class TestSExpressions:
         assert isinstance(sexp, LispListNode)
         assert isinstance(sexp.elements[1], LispQuotedNode)
 
+    def test_multiline_sexp(self):
+        ast = parse("(key-sig\n  '(c\n    major))\nc")
+        events = ast.children[0].events
+        sexp = events[0]
+        assert isinstance(sexp, LispListNode)
+        assert sexp.elements[0].name == "key-sig"
+        assert [e.name for e in sexp.elements[1].value.elements] == ["c", "major"]
+        assert isinstance(events[1], NoteNode)
+
+    def test_unclosed_multiline_sexp(self):
+        with pytest.raises(AldaSyntaxError):
+            parse("(tempo\n120\n")
+
 
 class TestComplexExamples:
     """Test complete Alda snippets."""
@@ -375,6 +388,18 @@ class TestRest:
         rest = ast.children[0].events[0]
         assert rest.duration.components[0].dots == 1
 
+    def test_subclass_override_is_used(self):
+        """Event dispatch goes through the instance, so overrides apply."""
+        from aldakit.parser import Parser
+
+        class BarlineRestParser(Parser):
+            def _parse_rest(self):
+                return BarlineNode(position=self._advance().position)
+
+        ast = BarlineRestParser.from_source("c r d").parse()
+        events = ast.children[0].events
+        assert [type(e) for e in events] == [NoteNode, BarlineNode, NoteNode]
+
 
 class TestVariables:
     """Test parsing of variables."""
@@ -587,3 +612,12 @@ class TestComplexExpressions:
         assert isinstance(bracketed, BracketedSequenceNode)
         # First event should be on-repetition
         assert isinstance(bracketed.events.events[0], OnRepetitionsNode)
+
+
+class TestNodeLayout:
+    def test_nodes_have_no_instance_dict(self):
+        ast = parse("piano: (tempo 120) o4 c8 d/f > e-4. | r2")
+        part = ast.children[0]
+        nodes = [ast, part, part.declaration, part.events, *part.events.events]
+        for node in nodes:
+            assert not hasattr(node, "__dict__"), type(node).__name__
@@ -1,7 +1,7 @@
 """Tests for REPL module components."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Initialize vendored packages path
 from aldakit import ext  # noqa: F401
@@ -201,6 +201,22 @@ class TestAldaLexer:
         note_tokens = [(cls, txt) for cls, txt in tokens_1 if cls == "class:note"]
         assert len(note_tokens) == 3
 
+    def test_repeated_lines_lexed_independently(self):
+        """Identical lines give equal but separate token lists."""
+        lexer = AldaLexer()
+        doc = Document("c d e\nc d e")
+        get_line_tokens = lexer.lex_document(doc)
+
+        first = get_line_tokens(0)
+        first.clear()
+        assert get_line_tokens(1) == [
+            ("class:note", "c"),
+            ("", " "),
+            ("class:note", "d"),
+            ("", " "),
+            ("class:note", "e"),
+        ]
+
 
 # =============================================================================
 # AldaCompleter Tests
@@ -242,6 +258,16 @@ class TestAldaCompleter:
         # Should include violin, viola, etc.
         assert any("violin:" in label for label in labels)
 
+    def test_complete_returns_every_match_in_order(self):
+        """All instruments with the prefix are offered, alphabetically."""
+        completer = AldaCompleter()
+        doc = Document("vio")
+
+        labels = [c.text for c in completer.get_completions(doc, None)]
+
+        expected = [f"{name}: " for name in completer.instruments if name[:3] == "vio"]
+        assert labels == expected
+
     def test_complete_attribute(self):
         """Complete attributes after opening paren."""
         completer = AldaCompleter()
@@ -278,10 +304,15 @@ class TestCreateKeyBindings:
 
     def test_creates_bindings(self):
         """Create key bindings successfully."""
-        mock_backend = MagicMock()
-        mock_backend.is_playing.return_value = False
 
-        kb = create_key_bindings(mock_backend)
+        class DummyBackend:
+            def is_playing(self):
+                return False
+
+            def stop(self):
+                pass
+
+        kb = create_key_bindings(DummyBackend())
 
         assert kb is not None
         # Should have some bindings registered
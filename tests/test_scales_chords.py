@@ -15,6 +15,8 @@ from aldakit.compose import (
     transpose_scale,
     interval_name,
     list_scales,
+    SCALE_INTERVALS,
+    CHORD_INTERVALS,
     build_chord,
     major,
     minor,
@@ -110,6 +112,18 @@ class TestScale:
         with pytest.raises(ValueError, match="Invalid root note"):
             scale("x", "major")
 
+    def test_returns_fresh_list(self):
+        """Mutating a returned scale does not affect later calls."""
+        scale("c", "major").append("x")
+        assert scale("c", "major") == ["c", "d", "e", "f", "g", "a", "b"]
+
+    def test_follows_scale_interval_changes(self, monkeypatch):
+        """Scales added to or changed in SCALE_INTERVALS are picked up."""
+        monkeypatch.setitem(SCALE_INTERVALS, "fifths", (0, 7))
+        assert scale("d", "fifths") == ["d", "a"]
+        monkeypatch.setitem(SCALE_INTERVALS, "fifths", (0, 5))
+        assert scale("d", "fifths") == ["d", "g"]
+
 
 class TestScaleNotes:
     """Tests for scale_notes function (returns Seq)."""
@@ -138,6 +152,24 @@ class TestScaleNotes:
         pitches = [n.pitch for n in result.elements]
         assert pitches == ["b", "a", "g", "f", "e", "d", "c"]
 
+    def test_octave_wraps_past_b(self):
+        """Notes after b move up an octave."""
+        result = scale_notes("a", "minor", octave=3)
+        octaves = [n.octave for n in result.elements]
+        assert octaves == [3, 3, 4, 4, 4, 4, 4]
+
+    def test_sequences_are_independent(self):
+        """Changing one returned Seq does not affect the next call."""
+        scale_notes("c", "major").elements.clear()
+        assert len(scale_notes("c", "major").elements) == 7
+
+    def test_int_and_float_durations_kept_apart(self):
+        """Equal-valued int and float durations each render as given."""
+        as_int = scale_notes("g", "major", duration=4)
+        as_float = scale_notes("g", "major", duration=4.0)
+        assert as_int.elements[0].to_alda() == "g4"
+        assert as_float.elements[0].to_alda() == "g4.0"
+
 
 class TestScaleDegree:
     """Tests for scale_degree function."""
@@ -236,6 +268,11 @@ class TestTransposeScale:
         result = transpose_scale(["c+", "d+"], 2)
         assert result == ["d+", "f"]
 
+    def test_transpose_down_across_c(self):
+        """Flats and uppercase names wrap below C."""
+        result = transpose_scale(["C", "d-", "e"], -2)
+        assert result == ["a+", "b", "d"]
+
 
 class TestIntervalName:
     """Tests for interval_name function."""
@@ -307,6 +344,23 @@ class TestBuildChord:
         with pytest.raises(ValueError, match="Unknown chord type"):
             build_chord("c", "nonexistent")
 
+    def test_follows_chord_interval_changes(self, monkeypatch):
+        """Editing CHORD_INTERVALS is picked up by later builds."""
+        monkeypatch.setitem(CHORD_INTERVALS, "stack", (0, 7))
+        assert [n.pitch for n in build_chord("c", "stack").notes] == ["c", "g"]
+        monkeypatch.setitem(CHORD_INTERVALS, "stack", (0, 5))
+        assert [n.pitch for n in build_chord("c", "stack").notes] == ["c", "f"]
+
+    def test_duration_applies_per_call(self):
+        """Chords differing only in duration keep their own duration."""
+        assert build_chord("c", "major", duration=2).duration == 2
+        assert build_chord("c", "major").duration is None
+
+    def test_identical_chords_are_shared(self):
+        """Repeated identical builds return the same immutable Chord."""
+        assert build_chord("c", "major") is build_chord("c", "major")
+        assert build_chord("c", "major") is not build_chord("c", "major", octave=5)
+
 
 class TestTriadConstructors:
     """Tests for triad constructor functions."""
@@ -426,6 +480,13 @@ class TestArpeggiate:
         for n in arp:
             assert n.duration == 16
 
+    def test_pattern_wraps_indices(self):
+        """Indices wrap around the chord size."""
+        chord = major("c")
+        arp = arpeggiate(chord, [3, -1, 4], duration=8)
+        assert [n.pitch for n in arp] == ["c", "g", "e"]
+        assert all(n.duration == 8 for n in arp)
+
 
 class TestInvertChord:
     """Tests for invert_chord function."""